@@ -10,19 +10,8 @@ newday () {
 }
 
 # AoC runday command
+# Runs the latest day, the days given, or --all days in one interpreter
+# e.g. runday 5 7 --jobs 2
 runday () {
-    if [ "$1" != "" ]
-    then
-        AoCDIR=$(printf "%02d" $1)
-        echo "Running Day$AoCDIR"
-        python /Users/work/dev/AoC2023/Day$AoCDIR/Day$AoCDIR.py > /Users/work/dev/AoC2023/Day$AoCDIR/Day$AoCDIR.out
-    else
-        local AoCDIR=$(print -l Day[0-9][0-9](/N) 2> /dev/null | tail -n 1)
-        if [[ -n $AoCDIR ]]; then
-            echo "Running $AoCDIR"
-            python /Users/work/dev/AoC2023/$AoCDIR/$AoCDIR.py > /Users/work/dev/AoC2023/$AoCDIR/$AoCDIR.out
-        else
-            echo "No 'DayXX' directories found."
-        fi
-    fi
+    python /Users/work/dev/AoC2023/runner.py "$@"
 }
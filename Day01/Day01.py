@@ -1,54 +1,103 @@
-"""AoC :: Day 1"""
+"""
+AoC :: Day 1
+
+For calibration documents too large to read into memory, calibrate_file()
+memory-maps the file and scans it in parallel chunks:
+
+e.g. py Day01/Day01.py huge.txt --jobs 8
+"""
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import os
+import sys
 import time
 import re
-from typing import List
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 1
 
 
 # Parse inputs
-with open('Day01/Day01.in', encoding="utf8") as f:
-    inputs = [i[:-1] for i in f.readlines()]
+def parse_input(text: str) -> bytes:
+    """The calibration document as bytes, which the scanners search directly"""
+    return text.encode()
 
 
-# part one
-def part_one(args: List[str]):
-    """Solution to part one"""
-    pattern = re.compile(r"\d")
+# Spelled out digits count too in part two
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+VALUES = {str(i).encode(): i for i in range(10)} | {w.encode(): i for i, w in enumerate(WORDS, 1)}
+
+def scanner(words: bool = False) -> re.Pattern:
+    """
+    One regex that finds the first and last digit of every line in a single pass
+
+    The lazy .*? stops at the first digit without consuming it (the
+    lookahead), then the greedy .* runs to the end of the line and backtracks
+    to the start of the last digit. That finds the last digit from the end of
+    the line without reversing it, and overlapping words like "oneight" still
+    end in "eight".
+    """
+    digit = rb"\d|" + "|".join(WORDS).encode() if words else rb"\d"
+    return re.compile(rb"(?m)^.*?(?=(%s)).*(%s)" % (digit, digit))
+
+SCANNERS = {False: scanner(words=False), True: scanner(words=True)}
+
+def calibrate(document: bytes | mmap.mmap, words: bool = False, start: int = 0, end: int = None):
+    """sum the calibration values of the lines in document[start:end]"""
+    end = len(document) if end is None else end
+    return sum(
+        10 * VALUES[first] + VALUES[last] for first, last in SCANNERS[words].findall(document, start, end)
+    )
+
+def chunks(document: bytes | mmap.mmap, n: int) -> list[tuple[int, int]]:
+    """split a document into about n (start, end) byte ranges that break after a newline"""
+    bounds = [0]
+    for k in range(1, n):
+        cut = document.find(b"\n", max(bounds[-1], len(document) * k // n)) + 1
+        if cut == 0:
+            break
+        bounds.append(cut)
+    bounds.append(len(document))
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+def calibrate_chunk(path: str, start: int, end: int):
+    """both calibration sums for a byte range of a file, read through mmap"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as document:
+        return calibrate(document, False, start, end), calibrate(document, True, start, end)
+
+def calibrate_file(path: str, jobs: int = None):
+    """
+    Both answers for a calibration document on disk, however large
 
-    def first_and_last(s: str):
-        first, last = pattern.search(s).group(0), pattern.search(s[::-1]).group(0)
-        return int(first + last)
+    The file is memory-mapped rather than read, split into one chunk per
+    worker on line boundaries, and each worker maps and scans its own chunk.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if os.path.getsize(path) == 0:
+        return 0, 0
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as document:
+        ranges = chunks(document, jobs)
+    if len(ranges) == 1:
+        return calibrate_chunk(path, *ranges[0])
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        sums = list(pool.map(calibrate_chunk, [path] * len(ranges), *zip(*ranges)))
+    return sum(s[0] for s in sums), sum(s[1] for s in sums)
 
-    return sum(first_and_last(arg) for arg in args)
+
+# part one
+def part_one(document: bytes):
+    """Solution to part one"""
+    return calibrate(document)
 
 # part two
-def part_two(args: List[str]):
+def part_two(document: bytes):
     """Solution to part two"""
-    # We need to map the keys here to their correct digits
-    mapping = {
-        "one": "1",
-        "two": "2",
-        "three": "3",
-        "four": "4",
-        "five": "5",
-        "six": "6",
-        "seven": "7",
-        "eight": "8",
-        "nine": "9",
-    }
-    word_digits = "|".join(mapping.keys())
-    pattern = re.compile(fr"{word_digits}|\d")
-    reversed_pattern = re.compile((fr"{word_digits[::-1]}|\d"))
-
-    def first_and_last(s: str):
-        first, last = pattern.search(s).group(0), reversed_pattern.search(s[::-1]).group(0)
-        return int(mapping.get(first, first) + mapping.get(last[::-1], last))
-
-    return sum(first_and_last(arg) for arg in args)
+    return calibrate(document, words=True)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
@@ -69,5 +118,26 @@ def main():
     print(f":: total runtime: {t1+t2: .4f}s ::")
 
 
+def main_file(path: str, jobs: int = None):
+    """Both answers for a large document on disk"""
+    print(f":: Advent of Code 2023 -- Day {day} ::")
+    t = -time.time()
+    a1, a2 = calibrate_file(path, jobs)
+    t += time.time()
+    print(":: Part One ::")
+    print(f"Answer: {a1}")
+    print(":: Part Two ::")
+    print(f"Answer: {a2}")
+    print(f":: total runtime: {t: .4f}s ::")
+
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        import argparse
+        parser = argparse.ArgumentParser(description="Scan a calibration document in parallel chunks")
+        parser.add_argument("path")
+        parser.add_argument("-j", "--jobs", type=int, help="worker processes (defaults to one per CPU)")
+        args = parser.parse_args()
+        main_file(args.path, args.jobs)
+    else:
+        main()
@@ -1,71 +1,103 @@
 """AoC :: Day 2"""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import os
 import re
+import sys
 import time
-from typing import List
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 2
 
-@dataclass
-class Cubes:
-    """Some collection of coloured cubes"""
-    red: int = 0
-    green: int = 0
-    blue: int = 0
-
-    def __le__(self, other: "Cubes"):
-        """This makes comparison easier in part one"""
-        return (self.red <= other.red) and (self.green <= other.green) and (self.blue <= other.blue)
-
-    @property
-    def power(self):
-        """The equation for power described in part two"""
-        return self.red * self.green * self.blue
+# The bag in part one, as (red, green, blue)
+BAG = (12, 13, 14)
+COLOURS = {"red": 0, "green": 1, "blue": 2}
+# The most game x bag comparisons to broadcast at once
+BLOCK = 1 << 22
 
 # Parse inputs
-re_game = re.compile(r"((?:\d+ \w+(?:, )?)+);?")
-re_cube = re.compile(r"((\d+) (\w+))+")
+re_cube = re.compile(r"(\d+) (\w+)")
 
-def parse(s: str) -> List[Cubes]:
-    """Parse a game into a list of cubes"""
-    shown = re_game.findall(s)
-    return [
-        Cubes(**{
-            color: int(n) for _, n, color in re_cube.findall(cubes)
-        }) for cubes in shown
-    ]
+def parse(s: str) -> tuple[int, int, int]:
+    """The most cubes of each colour shown at once in a game, which is all the bag needs"""
+    maxima = [0, 0, 0]
+    for n, colour in re_cube.findall(s):
+        i = COLOURS[colour]
+        maxima[i] = max(maxima[i], int(n))
+    return tuple(maxima)
 
-with open('Day02/Day02.in', encoding="utf8") as f:
-    inputs = [parse(i) for i in f.readlines()]
+@dataclass
+class Games:
+    """
+    The per-colour maxima of every game, game i + 1 at index i
+
+    With NumPy, array holds the same maxima as an (n_games x 3) int64 array
+    for answering batches of bags with possible().
+    """
+    maxima: list[tuple[int, int, int]]
+    array: object = field(default=None, repr=False, compare=False)
+
+def parse_input(text: str) -> Games:
+    """Parse every game into its per-colour maxima"""
+    games = Games([parse(i) for i in text.splitlines()])
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return games
+    games.array = np.array(games.maxima, dtype=np.int64).reshape(-1, 3)
+    return games
+
+
+def fits(games: Games, bag: tuple[int, int, int]) -> int:
+    """The sum of the ids of the games that could have been played with a bag"""
+    red, green, blue = bag
+    return sum(i for i, (r, g, b) in enumerate(games.maxima, 1) if r <= red and g <= green and b <= blue)
+
+def possible(games: Games, bags) -> list[int]:
+    """
+    fits() for each of many bags
+
+    A game is possible if a bag holds at least its maxima of every colour.
+    With NumPy, each block of bags is checked against every game with one
+    broadcast comparison per colour and the ids of the games that fit are
+    summed with a matrix product.
+    """
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return [fits(games, bag) for bag in bags]
+    if games.array is None:
+        # Parsed (and maybe cached) without NumPy
+        games.array = np.array(games.maxima, dtype=np.int64).reshape(-1, 3)
+    bags = np.asarray(bags, dtype=np.int64).reshape(-1, 3)
+    ids = np.arange(1, len(games.maxima) + 1, dtype=np.int64)
+    red, green, blue = games.array.T
+    block = max(1, BLOCK // max(len(games.maxima), 1))
+    sums = []
+    for start in range(0, len(bags), block):
+        bag = bags[start:start + block]
+        fits_bag = (red <= bag[:, 0, None]) & (green <= bag[:, 1, None]) & (blue <= bag[:, 2, None])
+        sums.extend((fits_bag @ ids).tolist())
+    return sums
+
+def power(games: Games) -> int:
+    """The sum of the powers of the smallest bag for each game"""
+    return sum(r * g * b for r, g, b in games.maxima)
 
 
 # part one
-def part_one(games: List[List[Cubes]], hypothesis: Cubes = Cubes(12, 13, 14)):
+def part_one(games: Games, hypothesis: tuple[int, int, int] = BAG):
     """Solution to part one"""
-    def possible(game: List[Cubes], hypothesis: Cubes = hypothesis):
-        """Determine if a game is possible given a hypothesis game"""
-        for shown in game:
-            if hypothesis <= shown:
-                return False
-        return True
-
-    return sum(i+1 for i, game in enumerate(games) if possible(game))
+    return fits(games, hypothesis)
 
 # part two
-def part_two(games: List[List[Cubes]]):
+def part_two(games: Games):
     """Solution to part two"""
-    min_cubes = [
-        Cubes(
-            red = max(cubes.red for cubes in game),
-            green = max(cubes.green for cubes in game),
-            blue = max(cubes.blue for cubes in game)
-        ) for game in games
-    ]
-
-    return sum(cube.power for cube in min_cubes)
+    return power(games)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
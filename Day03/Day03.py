@@ -1,7 +1,19 @@
-"""AoC :: Day 3"""
+"""
+AoC :: Day 3
+
+For schematics too large to hold in memory, stream() reads one row at a
+time and keeps only the three rows around the one being finished:
+
+e.g. py Day03/Day03.py huge.txt
+"""
+from bisect import bisect_right
 from dataclasses import dataclass
+import os
+import sys
 import time
-from typing import Set, Tuple
+from typing import Iterable, Iterator, List, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 3
 
 
@@ -13,16 +25,6 @@ class Number:
     row: int
     start: int
     end: int
-    # This caches the coord calculation so it isn't repeated unnecessarily
-    _surrounding_coordinates: Tuple[int, int] = None
-
-    @property
-    def surrounding_coordinates(self):
-        """return all the """
-        if self._surrounding_coordinates is None:
-            self._surrounding_coordinates = {(r, c) for r in range(self.row-1, self.row+2) for c in range(self.start-1, self.end+2)}
-        return self._surrounding_coordinates
-
 
     def __hash__(self):
         return hash((self.n, self.row, self.start, self.end, "Number"))
@@ -37,74 +39,145 @@ class Symbol:
     def __hash__(self):
         return hash((self.char, self.row, self.col, "Symbol"))
 
+class NumberIndex:
+    """
+    Numbers bucketed by row, each row sorted by start column
+
+    Numbers on a row don't overlap, so sorting them by start sorts them by
+    end too. The numbers next to a cell are found by bisecting the start
+    columns of the three rows around it, which only ever inspects a few
+    numbers however wide or long the schematic is.
+    """
+    def __init__(self, numbers: Iterable[Number]):
+        self.rows: dict[int, List[Number]] = {}
+        for number in sorted(numbers, key=lambda number: (number.row, number.start)):
+            self.rows.setdefault(number.row, []).append(number)
+        self.starts = {row: [number.start for number in bucket] for row, bucket in self.rows.items()}
+
+    def __iter__(self):
+        return (number for bucket in self.rows.values() for number in bucket)
+
+    def around(self, row: int, col: int) -> List[Number]:
+        """the numbers next to a coordinate"""
+        adjacent = []
+        for r in range(row - 1, row + 2):
+            if r not in self.rows:
+                continue
+            bucket = self.rows[r]
+            # the numbers that start by col + 1, walking back while they reach col - 1
+            i = bisect_right(self.starts[r], col + 1) - 1
+            while i >= 0 and bucket[i].end >= col - 1:
+                adjacent.append(bucket[i])
+                i -= 1
+        return adjacent
+
 # Don't need to construct this more than once
 DIGITS = {str(i) for i in range(10)}
 
-def parse(s: str, row: int):
-    """parse inputs"""
-    numbers = set()
-    symbols = set()
+def parse(s: str, row: int) -> Tuple[List[Number], List[Symbol]]:
+    """parse a row into its numbers and symbols, both in column order"""
+    numbers = []
+    symbols = []
     acc = ""
 
     for i, char in enumerate(s):
         if char in (".", "\n"):
             if acc:
-                numbers.add(Number(int(acc), row, i-len(acc), i-1))
+                numbers.append(Number(int(acc), row, i-len(acc), i-1))
             acc = ""
         elif char in DIGITS:
             acc += char
         else:
             if acc:
-                numbers.add(Number(int(acc), row, i-len(acc), i-1))
-            symbols.add(Symbol(char, row, i))
+                numbers.append(Number(int(acc), row, i-len(acc), i-1))
+            symbols.append(Symbol(char, row, i))
             acc = ""
-    return set(numbers), set(symbols)
-
-
-with open('Day03/Day03.in', encoding="utf8") as f:
-    NUMBERS: Set[Number] = set()
-    SYMBOLS: Set[Symbol] = set()
-    for r, line in enumerate(f.readlines()):
+    # A number can end the row
+    if acc:
+        numbers.append(Number(int(acc), row, len(s)-len(acc), len(s)-1))
+    return numbers, symbols
+
+def parse_input(text: str) -> Tuple[NumberIndex, List[Symbol]]:
+    """parse the whole schematic into an index of its numbers and a list of its symbols"""
+    numbers: List[Number] = []
+    symbols: List[Symbol] = []
+    for r, line in enumerate(text.splitlines()):
         matches, syms = parse(line, r)
-        NUMBERS |= matches
-        SYMBOLS |= syms
+        numbers += matches
+        symbols += syms
+    return NumberIndex(numbers), symbols
 
 
 # part one
-def part_one(numbers: Set[Number], symbols: Set[Symbol]):
-    """Solution to part one"""
-    coords = {(symbol.row, symbol.col) for symbol in symbols}
-
-    def part_number_check(number: Number, coords: Set[Tuple[int, int]]=coords):
-        """Return whether the number is a part number based on the coordinates of symbols"""
-        return bool(number.surrounding_coordinates & coords)
+def find_part_numbers(numbers: NumberIndex, symbols: List[Symbol]):
+    """Return the numbers adjacent to a symbol"""
+    return {number for symbol in symbols for number in numbers.around(symbol.row, symbol.col)}
 
-    part_numbers = {number for number in numbers if part_number_check(number, coords)}
-    # Return part numbers for an easier part two
-    return sum(number.n for number in part_numbers), part_numbers
+def part_one(schematic: Tuple[NumberIndex, List[Symbol]]):
+    """Solution to part one"""
+    return sum(number.n for number in find_part_numbers(*schematic))
 
 # part two
-def part_two(part_numbers: Set[Number], symbols: Set[Symbol]):
+def gear_ratio(symbol: Symbol, numbers: NumberIndex):
+    """Calculate the gear ratio for a symbol and return 0 if it isn't a gear"""
+    if symbol.char == "*":
+        gears = numbers.around(symbol.row, symbol.col)
+        if len(gears) == 2:
+            return gears[0].n * gears[1].n
+    return 0
+
+def part_two(schematic: Tuple[NumberIndex, List[Symbol]]):
     """Solution to part two"""
-    def gear_ratio(symbol: Symbol, part_numbers: Set[Number] = part_numbers):
-        """Calculate the gear ratio for a symbol and return 0 if it isn't a gear"""
-        if symbol.char == "*":
-            gears = [number for number in part_numbers if (symbol.row, symbol.col) in number.surrounding_coordinates]
-            if len(gears) == 2:
-                return gears[0].n * gears[1].n
-        return 0
-
-    return sum(gear_ratio(symbol) for symbol in symbols)
+    numbers, symbols = schematic
+    return sum(gear_ratio(symbol, numbers) for symbol in symbols)
+
+# streaming
+def settle(row: int, above, middle, below) -> Tuple[int, int]:
+    """the part number and gear ratio sums of a row, given it and the parsed rows either side"""
+    numbers = NumberIndex(above[0] + middle[0] + below[0])
+    part_numbers = {
+        number for symbol in above[1] + middle[1] + below[1]
+        for number in numbers.around(symbol.row, symbol.col) if number.row == row
+    }
+    return sum(number.n for number in part_numbers), sum(gear_ratio(symbol, numbers) for symbol in middle[1])
+
+def stream(lines: Iterable[str]) -> Iterator[Tuple[int, int]]:
+    """
+    The part number and gear ratio sums of each row, as soon as the row below it is read
+
+    Only three parsed rows are held at once, so memory grows with the width
+    of the schematic but not its length.
+    """
+    above, middle = ([], []), None
+    row = -1
+    for row, line in enumerate(lines):
+        below = parse(line, row)
+        if middle is not None:
+            yield settle(row - 1, above, middle, below)
+            above = middle
+        middle = below
+    if middle is not None:
+        yield settle(row, above, middle, ([], []))
+
+def stream_file(path: str) -> Tuple[int, int]:
+    """both answers for a schematic on disk, streamed a row at a time"""
+    a1 = a2 = 0
+    with open(path, encoding="utf8") as f:
+        for part_numbers, gear_ratios in stream(f):
+            a1 += part_numbers
+            a2 += gear_ratios
+    return a1, a2
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1, part_numbers = part_one(NUMBERS, SYMBOLS)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -112,12 +185,32 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(part_numbers, SYMBOLS)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
     print(f":: total runtime: {t1+t2: .4f}s ::")
 
 
+def main_file(path: str):
+    """Both answers for a large schematic on disk"""
+    print(f":: Advent of Code 2023 -- Day {day} ::")
+    t = -time.time()
+    a1, a2 = stream_file(path)
+    t += time.time()
+    print(":: Part One ::")
+    print(f"Answer: {a1}")
+    print(":: Part Two ::")
+    print(f"Answer: {a2}")
+    print(f":: total runtime: {t: .4f}s ::")
+
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        import argparse
+        parser = argparse.ArgumentParser(description="Stream a schematic a row at a time")
+        parser.add_argument("path")
+        args = parser.parse_args()
+        main_file(args.path)
+    else:
+        main()
@@ -1,55 +1,155 @@
-"""AoC :: Day 4"""
-from dataclasses import dataclass
+"""
+AoC :: Day 4
+
+For millions of scratchcards, solve_batch() parses a whole table of
+fixed-width cards with NumPy instead of line by line:
+
+e.g. a1, a2 = solve_batch(open("huge.txt").read())
+"""
+from dataclasses import dataclass, field
+import os
 import re
+import sys
 import time
-from typing import List, Set
+from typing import List, Sequence
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 4
 
 
 # Parse inputs
 @dataclass
 class Ticket:
-    """A representation of a ticket"""
-    win: Set[int]
-    has: Set[int]
+    """A representation of a ticket, with its numbers as bitmasks (bit n set for number n)"""
+    win: int
+    has: int
+    matches: int = field(init=False)
+
+    def __post_init__(self):
+        # The number of winning matches on the card
+        self.matches = (self.win & self.has).bit_count()
 
     @property
     def points(self):
         """The number of points from part one"""
-        return int(2**(len(self.win & self.has) - 1))
+        return 1 << (self.matches - 1) if self.matches else 0
 
-    def matches(self):
-        """The number of winning matches on the card"""
-        return len(self.win & self.has)
+def bitmask(numbers: Sequence[str]) -> int:
+    """a set of numbers as an int with those bits set"""
+    mask = 0
+    for n in numbers:
+        mask |= 1 << int(n)
+    return mask
 
 re_digits = re.compile(r"\d+")
 def parse(s: str):
     """Turn a string into a Ticket dataclass"""
     win, has = s.split(":")[1].split("|")
-    return Ticket({int(n) for n in re_digits.findall(win)}, {int(n) for n in re_digits.findall(has)})
+    return Ticket(bitmask(re_digits.findall(win)), bitmask(re_digits.findall(has)))
+
+def parse_input(text: str) -> List[Ticket]:
+    """Parse every ticket"""
+    return [parse(i) for i in text.splitlines()]
+
+
+def points(matches: Sequence[int]) -> int:
+    """the total points of cards with these numbers of matches"""
+    return sum(1 << (m - 1) for m in matches if m)
+
+def copies(matches: Sequence[int]) -> int:
+    """
+    The total number of cards held once every card has been scratched
+
+    Card i adds its copies to each of the next matches[i] cards. Rather than
+    adding to each of them, the copies are added where the run starts and
+    taken off where it ends in a difference array, and a running sum of it
+    gives the copies of each card won by the cards before it.
+    """
+    n = len(matches)
+    diff = [0] * (n + 1)
+    running = total = 0
+    for i, m in enumerate(matches):
+        running += diff[i]
+        held = running + 1
+        total += held
+        if m:
+            diff[i + 1] += held
+            diff[min(i + m + 1, n)] -= held
+    return total
+
+# The most cards to parse with NumPy at once
+BLOCK = 1 << 16
+
+def batch_matches(text: str):
+    """
+    The number of matches on every card of a table of fixed-width cards
+
+    Every line must be the same length, with each number right-aligned in a
+    three character field as in the puzzle input, so numbers go up to 99.
+    They are stored as bits in two uint64 words per card, and a card's
+    matches are the bits its numbers pick out of its winning words. Raises a
+    ValueError if the table isn't aligned.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    data = np.frombuffer(text.encode(), dtype=np.uint8)
+    width = text.find("\n") + 1
+    colon, bar = text.find(":"), text.find("|")
+    if not 0 < colon < bar < width - 1 or len(data) % width or (bar - colon - 2) % 3 or (width - bar - 2) % 3:
+        raise ValueError("cards must be fixed-width lines of right-aligned numbers")
+    rows = data.reshape(-1, width)
+    if (rows[:, colon] != ord(":")).any() or (rows[:, bar] != ord("|")).any():
+        raise ValueError("cards must be fixed-width lines of right-aligned numbers")
+
+    def numbers(block, start: int, end: int):
+        """the right-aligned numbers in columns start to end of a block of rows"""
+        fields = block[:, start:end].reshape(len(block), -1, 3).astype(np.uint64)
+        if (fields[:, :, 0] != ord(" ")).any():
+            raise ValueError("cards must be fixed-width lines of right-aligned numbers")
+        tens = np.where(fields[:, :, 1] == ord(" "), ord("0"), fields[:, :, 1])
+        return (tens - ord("0")) * 10 + fields[:, :, 2] - ord("0")
+
+    one = np.uint64(1)
+    matches = np.empty(len(rows), dtype=np.int64)
+    for first in range(0, len(rows), BLOCK):
+        block = rows[first:first + BLOCK]
+        win = numbers(block, colon + 1, bar - 1)
+        has = numbers(block, bar + 1, width - 1)
+        bits = one << (win & np.uint64(63))
+        low = np.bitwise_or.reduce(np.where(win < 64, bits, 0), axis=1)
+        high = np.bitwise_or.reduce(np.where(win < 64, 0, bits), axis=1)
+        words = np.where(has < 64, low[:, None], high[:, None])
+        matches[first:first + BLOCK] = ((words >> (has & np.uint64(63))) & one).sum(axis=1)
+    return matches
 
-with open('Day04/Day04.in', encoding="utf8") as f:
-    inputs = [parse(i) for i in f.readlines()]
+def solve_batch(text: str):
+    """both answers for a table of cards, parsed in bulk with NumPy where possible"""
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        matches = batch_matches(text)
+    except (ImportError, ValueError):
+        matches = [ticket.matches for ticket in parse_input(text)]
+        return points(matches), copies(matches)
+    won = matches[matches > 0]
+    if len(won) and len(won) << int(won.max() - 1) > 2**63 - 1:
+        # The total could overflow an int64, so score the cards exactly
+        return points(matches.tolist()), copies(matches.tolist())
+    return int(np.left_shift(1, won - 1).sum()), copies(matches.tolist())
 
 
 # part one
 def part_one(tickets: List[Ticket]):
     """Solution to part one"""
-    return sum(ticket.points for ticket in tickets)
+    return points([ticket.matches for ticket in tickets])
 
 # part two
 def part_two(tickets: List[Ticket]):
     """Solution to part two"""
-    copies = {i: 1 for i in range(len(tickets))}
-    for i, ticket in enumerate(tickets):
-        n = ticket.matches()
-        for j in range(1, n+1):
-            copies[i+j] += copies[i]
-    return sum(copies.values())
+    return copies([ticket.matches for ticket in tickets])
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
@@ -1,9 +1,18 @@
 """AoC :: Day 5"""
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import reduce
+import os
+import sys
 import time
-from typing import Dict, List
+from typing import Iterator, List, Sequence, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 5
 
+# The range of an int64, which lookup_many needs every value to stay within
+INT64_MIN, INT64_MAX = -2**63, 2**63 - 1
+
 
 # Parse inputs
 @dataclass
@@ -15,115 +24,223 @@ class Conversion:
 
 @dataclass
 class Map:
-    """A representation of a map"""
+    """
+    A representation of a map, with its conversions sorted by source
+
+    Conversions don't overlap, so conversion i covers starts[i] up to (but
+    not including) ends[i] and both lists are sorted. An item is converted
+    by adding offsets[i] of the conversion it falls in, found by bisection.
+    """
     name: str
     conversions: List[Conversion]
-    # dict maps from source to Conversion
-    _dict: Dict[int, Conversion] = None
-
-    def _to_dict(self):
-        if self._dict is None:
-            d = {}
-            for conversion in self.conversions:
-                d[conversion.source] = conversion
-            self._dict = d
-
-    def get_maps(self, source: int, r: int):
-        """get the maps relevant to a source and range"""
-        return sorted(
-            [c for c in self.conversions if (c.source <= source + r) and (source <= c.source + c.range)],
-            key=lambda conversion: conversion.source
-        )
+    starts: List[int] = field(init=False, repr=False)
+    ends: List[int] = field(init=False, repr=False)
+    offsets: List[int] = field(init=False, repr=False)
+    # int64 copies of the lists for lookup_many, built on first use, and
+    # whether every bound and converted bound fits in an int64 to begin with
+    _arrays: tuple = field(default=None, init=False, repr=False, compare=False)
+    _fits_int64: bool = field(default=True, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.conversions = sorted(self.conversions, key=lambda conversion: conversion.source)
+        self.starts = [c.source for c in self.conversions]
+        self.ends = [c.source + c.range for c in self.conversions]
+        self.offsets = [c.destination - c.source for c in self.conversions]
+        converted = [e + o for e, o in zip(self.ends, self.offsets)]
+        self._fits_int64 = all(fits_int64(a) for a in (self.starts, self.ends, self.offsets, converted))
 
     def __getitem__(self, item: int):
-        if not self._dict:
-            self._to_dict()
+        i = bisect_right(self.starts, item) - 1
+        if i >= 0 and item < self.ends[i]:
+            return item + self.offsets[i]
+        return item
+
+    def pieces(self, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+        """
+        Split start to end - 1 into the runs that convert alike
+
+        Yields (start, end, offset) for each run in order, with an offset of
+        0 for the gaps between conversions.
+        """
+        i = bisect_right(self.ends, start)
+        while start < end:
+            if i < len(self.starts) and self.starts[i] <= start:
+                stop = min(end, self.ends[i])
+                yield start, stop, self.offsets[i]
+                i += 1
+            else:
+                stop = min(end, self.starts[i]) if i < len(self.starts) else end
+                yield start, stop, 0
+            start = stop
+
+    def then(self, other: "Map") -> "Map":
+        """
+        One map that converts like this one followed by other
+
+        Outside every conversion of both maps nothing is converted, so only
+        the span between their lowest and highest bounds needs splitting:
+        first by this map's runs, then each run by the runs of other it
+        lands on. Adjacent runs with the same overall offset are merged.
+        """
+        name = self.name.partition("-to-")[0] + "-to-" + other.name.partition("-to-")[2]
+        bounds = self.starts + self.ends + other.starts + other.ends
+        if not bounds:
+            return Map(name, [])
+        conversions = []
+        for start, end, offset in self.pieces(min(bounds), max(bounds)):
+            for s, e, o in other.pieces(start + offset, end + offset):
+                if not offset + o:
+                    continue
+                last = conversions[-1] if conversions else None
+                if last and last.source + last.range == s - offset and last.destination - last.source == offset + o:
+                    last.range += e - s
+                else:
+                    conversions.append(Conversion(s + o, s - offset, e - s))
+        return Map(name, conversions)
+
+    def convert(self, ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Convert sorted, disjoint (start, end) ranges in one sweep
+
+        Both the ranges and the conversions are in order, so the conversion
+        a range starts in is found by walking on from where the last range
+        ended rather than searching. The converted ranges come back unsorted.
+        """
+        starts, ends, offsets = self.starts, self.ends, self.offsets
+        n = len(starts)
+        converted = []
+        i = 0
+        for start, end in ranges:
+            while i < n and ends[i] <= start:
+                i += 1
+            while start < end:
+                if i < n and starts[i] <= start:
+                    stop = min(end, ends[i])
+                    converted.append((start + offsets[i], stop + offsets[i]))
+                    if stop == ends[i]:
+                        i += 1
+                else:
+                    stop = min(end, starts[i]) if i < n else end
+                    converted.append((start, stop))
+                start = stop
+        return converted
+
+    def lookup_many(self, items: Sequence[int]):
+        """
+        Convert a batch of items at once
+
+        With NumPy this is one searchsorted over int64 arrays. Without it,
+        or when an item or a converted bound doesn't fit in an int64, items
+        are looked up one at a time into a list.
+        """
+        if not self._fits_int64 or not fits_int64(items):
+            return [self[item] for item in items]
         try:
-            _, M = max((k, m) for k, m in self._dict.items() if k <= item)
-        except ValueError:
-            return item
-        if (delta := item - M.source) < M.range:
-            return M.destination + (delta)
-        else:
-            return item
+            import numpy as np  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            return [self[item] for item in items]
+        items = np.asarray(items, dtype=np.int64)
+        if not self.conversions:
+            return items.copy()
+        if self._arrays is None:
+            self._arrays = tuple(np.array(a, dtype=np.int64) for a in (self.starts, self.ends, self.offsets))
+        starts, ends, offsets = self._arrays
+        i = np.maximum(np.searchsorted(starts, items, side="right") - 1, 0)
+        inside = (starts[i] <= items) & (items < ends[i])
+        return items + np.where(inside, offsets[i], 0)
 
 
+def fits_int64(values: Sequence[int]) -> bool:
+    """whether every value fits in an int64, using an array's own min and max"""
+    if not len(values):
+        return True
+    if hasattr(values, "dtype"):
+        return values.dtype == "int64" or (INT64_MIN <= values.min() and values.max() <= INT64_MAX)
+    return INT64_MIN <= min(values) and max(values) <= INT64_MAX
 
 def parse(title: str, numbers: str):
     """parse a map into a title and its array of conversions"""
     array = [Conversion(*[int(n) for n in row.split(" ")]) for row in numbers.strip().split("\n")]
     return Map(title, array)
 
-with open('Day05/Day05.in', encoding="utf8") as f:
-    SEEDS, *MAPS = f.read().split("\n\n")
-    SEEDS = [int(i) for i in SEEDS.split(" ")[1:]]
-    MAPS = [
-        parse(*m.split(":")) for m in MAPS
+def merge(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """sort (start, end) ranges and merge any that overlap or touch"""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def propagate(ranges: List[Tuple[int, int]], maps: List[Map]) -> List[Tuple[int, int]]:
+    """
+    Push a set of (start, end) ranges through each map in turn
+
+    The set is merged before and after every map, so ranges that land on
+    top of each other are only carried forward once and the set stays as
+    small as the maps allow. Returns the final ranges sorted and disjoint.
+    """
+    ranges = merge(ranges)
+    for m in maps:
+        ranges = merge(m.convert(ranges))
+    return ranges
+
+def fuse(maps: List[Map]) -> Map:
+    """compose a chain of maps into one map"""
+    return reduce(Map.then, maps) if maps else Map("identity", [])
+
+@dataclass
+class Almanac:
+    """
+    The seeds, the chain of maps, and the chain fused into one seed-to-location map
+
+    The fused map is built with the almanac, so the disk cache (AOC_CACHE=1)
+    keeps it between runs along with everything else.
+    """
+    seeds: List[int]
+    maps: List[Map]
+    location: Map = field(init=False)
+
+    def __post_init__(self):
+        self.location = fuse(self.maps)
+
+def parse_input(text: str) -> Almanac:
+    """parse the almanac into its seeds and maps"""
+    seeds, *maps = text.split("\n\n")
+    seeds = [int(i) for i in seeds.split()[1:]]
+    maps = [
+        parse(*m.split(":")) for m in maps
     ]
+    return Almanac(seeds, maps)
 
 
 # part one
-def part_one(seeds: List[int], maps: List[Map]):
+def part_one(almanac: Almanac):
     """Solution to part one"""
-    def location(seed: int, maps: List[Map]=maps):
-        """Use the Map __getitem__ to concisely handle this logic"""
-        for m in maps:
-            seed = m[seed]
-        return seed
-
-    return min(location(seed) for seed in seeds)
+    return min(almanac.location[seed] for seed in almanac.seeds)
 
 # part two
-def part_two(seeds: List[int], maps: List[Map]):
+def part_two(almanac: Almanac):
     """Solution to part two"""
+    seeds = almanac.seeds
     # Re-interpret seeds as ranges
-    seed_ranges = list(zip(seeds[0::2], seeds[1::2]))
-
-    def recursive_exploration(source: int, r: int, maps: List[Map]):
-        """Recursively figure out where the range is sent to"""
-        # If we haven't gone through all the maps, continue breaking them apart
-        if maps:
-            M = maps[0]
-            # Get the maps that will affect this range from source -> source + r - 1
-            conversions = M.get_maps(source, r)
-            # Init some vars for iteratively finding where to explore next
-            new_explorations = []
-            new_source = source
-            # For each relevant conversion, figure out how it breaks apart the current range
-            # (Note: conversions is sorted by conversion.source)
-            for conversion in conversions:
-                if new_source >= source + r - 1:
-                    break
-                # These are the possible breaks
-                sections = [
-                    (new_source, max(new_source, conversion.source) - 1),
-                    (max(new_source, conversion.source), min(source + r, conversion.source + conversion.range) - 1),
-                ]
-                new_source = min(source + r, conversion.source + conversion.range)
-                # Check each new interval has positive length
-                for section in sections:
-                    if section[0] <= section[1]:
-                        new_explorations.append((section[0], section[1] - section[0] + 1))
-            # Append on remainder if there is any in the range
-            if new_source <= source + r - 1:
-                new_explorations.append((new_source, (source + r + 1) - new_source - 1))
-            # Recurse
-            return min(recursive_exploration(M[new_s], new_r, maps[1:]) for new_s, new_r in new_explorations)
-        else:
-            # Return the source if there are no mappings, as this would be the minimum value possible in this range
-            return source
-
-    return min(recursive_exploration(s, r, maps) for s, r in seed_ranges)
+    seed_ranges = [(s, s + r) for s, r in zip(seeds[0::2], seeds[1::2])]
+    # One sweep through the fused map, and the ranges come out sorted, so
+    # the lowest location starts the first
+    return propagate(seed_ranges, [almanac.location])[0][0]
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(SEEDS, MAPS)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -131,7 +248,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(SEEDS, MAPS)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -1,11 +1,80 @@
-"""AoC :: Day 6"""
+"""
+AoC :: Day 6
+
+ways_many() counts the ways to win millions of races at once with NumPy,
+and --benchmark times it against the per-race loop on random races:
+
+e.g. py Day06/Day06.py --benchmark 1000000
+"""
 from dataclasses import dataclass
+import os
+import random
+import sys
 import time
 import re
 import math
-from typing import List
+from typing import List, Sequence
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 6
 
+# The largest time whose square fits in an int64, and so can be batched
+INT64_TIME = math.isqrt(2**63 - 1)
+
+
+def ways(race_time: int, distance: int) -> int:
+    """
+    The number of whole hold times that beat the record, exactly
+
+    Holding for h goes h * (race_time - h), which beats distance between
+    the roots of h^2 - race_time * h + distance. isqrt gives the lower root
+    to within one, which is corrected with the exact test, and the winning
+    hold times are symmetric about race_time / 2.
+    """
+    discriminant = race_time * race_time - 4 * distance
+    if discriminant <= 0:
+        return 0
+    lo = max(0, (race_time - math.isqrt(discriminant)) // 2)
+    while lo * (race_time - lo) <= distance and lo <= race_time // 2:
+        lo += 1
+    while lo > 0 and (lo - 1) * (race_time - lo + 1) > distance:
+        lo -= 1
+    return max(0, race_time - 2 * lo + 1)
+
+def extremes(values: Sequence[int]) -> tuple[int, int]:
+    """the smallest and largest values, with an array's own min and max if it has them"""
+    if hasattr(values, "dtype"):
+        return values.min(), values.max()
+    return min(values), max(values)
+
+def ways_many(times: Sequence[int], distances: Sequence[int]):
+    """
+    The number of ways to win each of a batch of races
+
+    With NumPy, and when every square time and record fits in an int64, the
+    lower roots come from a float sqrt and are nudged onto the exact boundary
+    with vectorized integer tests. Otherwise each race is counted exactly.
+    """
+    if len(times) == 0:
+        return []
+    (t_min, t_max), (d_min, d_max) = extremes(times), extremes(distances)
+    if t_min < 0 or d_min < 0 or t_max > INT64_TIME or d_max >= 2**61:
+        return [ways(int(t), int(d)) for t, d in zip(times, distances)]
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return [ways(int(t), int(d)) for t, d in zip(times, distances)]
+    t = np.asarray(times, dtype=np.int64)
+    d = np.asarray(distances, dtype=np.int64)
+    discriminant = t * t - 4 * d
+    lo = np.floor((t - np.sqrt(np.maximum(discriminant, 0))) / 2).astype(np.int64)
+    lo = np.clip(lo, 0, t // 2)
+    while (low := (lo * (t - lo) <= d) & (lo < t // 2)).any():
+        lo += low
+    while (high := (lo > 0) & ((lo - 1) * (t - lo + 1) > d)).any():
+        lo -= high
+    counts = np.where((discriminant > 0) & (lo * (t - lo) > d), t - 2 * lo + 1, 0)
+    return counts.tolist()
 
 # Parse inputs
 @dataclass
@@ -16,40 +85,68 @@ class Race:
 
     def ways_of_winning(self):
         """The number of ways you can win the race"""
-        delta = math.sqrt(self.time ** 2 - 4 * self.distance)
-        roots = ((self.time - delta)/2, (self.time + delta)/2)
-        return math.ceil(roots[1] - 1) - math.floor(roots[0] + 1) + 1
+        return ways(self.time, self.distance)
 
 re_digits = re.compile(r"\d+")
 
-with open('Day06/Day06.in', encoding="utf8") as f:
-    times, distances = [re_digits.findall(i.split(":")[1]) for i in f.readlines()]
-    RACES = [
+def parse_input(text: str) -> List[Race]:
+    """parse the races"""
+    times, distances = [re_digits.findall(i.split(":")[1]) for i in text.splitlines()]
+    return [
         Race(int(t), int(d)) for t, d in zip(times, distances)
     ]
-    NEW_RACE = Race(int(''.join(times)), int(''.join(distances)))
 
 # part one
-def product(ps: List[int]):
-    """Return the product of integers"""
-    if len(ps) > 1:
-        return ps[0] * product(ps[1:])
-    else:
-        return ps[0]
-
 def part_one(races: List[Race]):
     """Solution to part one"""
-    return product([race.ways_of_winning() for race in races])
+    return math.prod(race.ways_of_winning() for race in races)
+
+# part two
+def part_two(races: List[Race]):
+    """Solution to part two (the races are really one race with bad kerning)"""
+    new_race = Race(
+        int(''.join(str(race.time) for race in races)),
+        int(''.join(str(race.distance) for race in races))
+    )
+    return part_one([new_race])
+
+# compare the batch path with the per-race loop
+def benchmark(n: int, seed: int = 0):
+    """time ways_many against counting n random int64-sized races one at a time"""
+    rng = random.Random(seed)
+    times = [rng.randint(1, INT64_TIME) for _ in range(n)]
+    distances = [rng.randrange(t * t // 4) for t in times]
+    races = [Race(t, d) for t, d in zip(times, distances)]
+    print(f":: Advent of Code 2023 -- Day {day} :: {n:,} races")
+    try:
+        # Import NumPy up front so the batch isn't timed importing it
+        import numpy  # pylint: disable=import-outside-toplevel,unused-import
+        batch_path = "numpy"
+    except ImportError:
+        batch_path = "exact"
+
+    t1 = -time.perf_counter()
+    loop = [race.ways_of_winning() for race in races]
+    t1 += time.perf_counter()
+    print(f"per-race loop: {t1: .4f}s")
+
+    t2 = -time.perf_counter()
+    batch = ways_many(times, distances)
+    t2 += time.perf_counter()
+    print(f"{batch_path} batch: {t2: .4f}s ({t1 / t2:.1f}x)")
+    if batch != loop:
+        raise AssertionError("the batch and per-race counts differ")
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(RACES)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -57,7 +154,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_one([NEW_RACE])
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -65,4 +162,12 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        import argparse
+        parser = argparse.ArgumentParser(description="Benchmark the batch race counter")
+        parser.add_argument("--benchmark", type=int, metavar="N", required=True, help="number of random races")
+        parser.add_argument("--seed", type=int, default=0)
+        args = parser.parse_args()
+        benchmark(args.benchmark, args.seed)
+    else:
+        main()
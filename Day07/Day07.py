@@ -1,116 +1,174 @@
-"""AoC :: Day 7"""
-from dataclasses import dataclass
+"""
+AoC :: Day 7
+
+For millions of hands, Ranking ranks packed hand keys with a counting sort
+and answers rank and top-k queries, reading hands straight from a file
+without building a Hand for each:
+
+e.g. py Day07/Day07.py huge.txt
+"""
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+import os
+import sys
 import time
-from typing import List
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 7
 
 
 # Parse inputs
-# N.B. This changes in part two, but we change it at the class level
-PIPS = {str(i): i for i in range(2, 10)} | {
-    "T": 10,
-    "J": 11,
-    "Q": 12,
-    "K": 13,
-    "A": 14,
-}
+# The rank of each card, weakest first
+PIPS = {card: rank for rank, card in enumerate("23456789TJQKA")}
+# J is a joker in part two, the weakest card but wild when working out strength
+JOKER_PIPS = {card: rank for rank, card in enumerate("J23456789TQKA")}
+
+# (largest group, second largest group) -> strength, from high card (0) to five of a kind (6)
+STRENGTHS = {(1, 1): 0, (2, 1): 1, (2, 2): 2, (3, 1): 3, (3, 2): 4, (4, 1): 5, (5, 0): 6}
+
+def strength(cards: str, wild: str = None) -> int:
+    """The type of a hand, with any wild cards joining its largest group of matching cards"""
+    counts = Counter(cards)
+    jokers = counts.pop(wild, 0)
+    groups = sorted(counts.values(), reverse=True) + [0, 0]
+    return STRENGTHS[groups[0] + jokers, groups[1]]
+
+def pack(cards: str, pips: dict[str, int], wild: str = None) -> int:
+    """
+    A hand as one int that sorts the way hands rank
+
+    The strength is in the high bits, then the rank of each card in turn
+    in four bits apiece, so comparing two keys compares strengths and then
+    the cards from first to last.
+    """
+    key = strength(cards, wild)
+    for card in cards:
+        key = key << 4 | pips[card]
+    return key
 
 @dataclass
 class Hand:
-    """A hand of camel cards"""
+    """A hand of camel cards, with its sort keys for both parts"""
     cards: str
     bid: int
-    # cache strength
-    _strength: int = None
-    # class attribute
-    pips = PIPS
-
-    @property
-    def strength(self):
-        """The rank of the hand"""
-        if self._strength is None:
-            chars = set(self.cards)
-            freq = {char: self.cards.count(char) for char in chars}
-            vals = freq.values()
-            if 5 in vals:
-                self._strength = 6
-            elif 4 in vals:
-                self._strength = 5
-            elif 3 in vals:
-                if 2 in vals:
-                    self._strength = 4
-                else:
-                    self._strength = 3
-            elif 2 in vals:
-                pairs = len([v for v in vals if v == 2])
-                if pairs > 1:
-                    self._strength = 2
-                else:
-                    self._strength = 1
-            else:
-                self._strength = 0
-        # print(self._strength)
-        return self._strength
-
-    def __lt__(self, other: "Hand"):
-        """Figure out which hand is best"""
-        if self.strength != other.strength:
-            return self.strength < other.strength
-        for si, oi in zip(self.cards, other.cards):
-            if self.pips[si] == self.pips[oi]:
-                continue
-            else:
-                return self.pips[si] < self.pips[oi]
-        raise ValueError(f"These two hands are identical apparently: {self}, {other}")
-
-class Hand2(Hand):
-    """Alteration of hand for part two"""
-    # The values of J changes for part two
-    pips = PIPS | {"J": 1}
-
-    # As does how to calculate strength
-    @property
-    def strength(self):
-        """the rank of the hand as in part two"""
-        if self._strength is None:
-            if "J" in self.cards:
-                best_strength = 0
-                for r in self.pips:
-                    h = Hand(self.cards.replace("J", r), self.bid)
-                    best_strength = max(best_strength, h.strength)
-                self._strength = best_strength
-            else:
-                self._strength = super().strength
-        return self._strength
+    key: int = field(init=False)
+    joker_key: int = field(init=False)
+
+    def __post_init__(self):
+        self.key = pack(self.cards, PIPS)
+        self.joker_key = pack(self.cards, JOKER_PIPS, wild="J")
 
 def parse(s: str):
     """parse a hand/bid"""
     cards, bid = s.split(" ")
     return Hand(cards, int(bid))
 
-with open('Day07/Day07.in', encoding="utf8") as f:
-    HANDS = [parse(i[:-1]) for i in f.readlines()]
-
+def parse_input(text: str) -> List[Hand]:
+    """parse every hand"""
+    return [parse(i) for i in text.splitlines()]
+
+
+def keys(lines: Iterable[str], jokers: bool = False) -> Iterator[Tuple[int, int]]:
+    """(key, bid) for each hand/bid line, without keeping anything else"""
+    pips, wild = (JOKER_PIPS, "J") if jokers else (PIPS, None)
+    for line in lines:
+        cards, bid = line.split()
+        yield pack(cards, pips, wild), int(bid)
+
+def winnings(hands: Iterable[Tuple[int, int]]) -> int:
+    """the total of rank x bid for (key, bid) pairs, ranked by key (equal keys in the order given)"""
+    return sum((r+1) * bid for r, (_, bid) in enumerate(sorted(hands, key=lambda hand: hand[0])))
+
+# Each strength has 13^5 orders of cards, so keys can be counted into this many buckets
+ORDERS = 13 ** 5
+BUCKETS = 7 * ORDERS
+# Two packed card ranks (one byte of a key) as a number in base 13
+PAIRS = [(b >> 4) * 13 + (b & 15) for b in range(256)]
+
+def bucket(key: int) -> int:
+    """the position of a key among every possible key, from 0 to BUCKETS - 1"""
+    return (((key >> 20) * 13 + (key >> 16 & 15)) * 169 + PAIRS[key >> 8 & 255]) * 169 + PAIRS[key & 255]
+
+# Below this many hands sorted() is quicker than counting into buckets
+SORT_BELOW = 1 << 15
+
+class Ranking:
+    """
+    Hands in rank order, kept as parallel arrays of packed keys and bids
+
+    Built with a counting sort: count the keys in each bucket from the
+    lowest to the highest present, turn the counts into where each bucket
+    starts, then drop each hand into its bucket. There are no comparisons.
+    While building, it also holds unsorted copies of the keys and bids, each
+    hand's bucket, and two tables of one int per bucket in that span (the
+    counts and then the bucket starts); only the two sorted arrays are kept.
+    Fewer than SORT_BELOW hands are just sorted. Hands with the same key
+    keep their input order.
+    """
+    def __init__(self, hands: Iterable[Tuple[int, int]]):
+        unsorted_keys, unsorted_bids = array('q'), array('q')
+        for key, bid in hands:
+            unsorted_keys.append(key)
+            unsorted_bids.append(bid)
+        if len(unsorted_keys) < SORT_BELOW:
+            order = sorted(range(len(unsorted_keys)), key=unsorted_keys.__getitem__)
+            self.keys = array('q', [unsorted_keys[i] for i in order])
+            self.bids = array('q', [unsorted_bids[i] for i in order])
+            return
+        buckets = array('i', map(bucket, unsorted_keys))
+        lowest = min(buckets)
+        counts = array('i', [0]) * (max(buckets) - lowest + 2)
+        for b in buckets:
+            counts[b - lowest + 1] += 1
+        slot = array('i', accumulate(counts))
+        del counts
+        self.keys = array('q', [0]) * len(unsorted_keys)
+        self.bids = array('q', [0]) * len(unsorted_keys)
+        for key, bid, b in zip(unsorted_keys, unsorted_bids, buckets):
+            i = slot[b - lowest]
+            self.keys[i] = key
+            self.bids[i] = bid
+            slot[b - lowest] = i + 1
+
+    def __len__(self):
+        return len(self.keys)
+
+    def winnings(self) -> int:
+        """the total of rank x bid"""
+        return sum((r+1) * bid for r, bid in enumerate(self.bids))
+
+    def rank(self, key: int) -> int:
+        """the rank a hand with this key would have, one more than the number of weaker hands"""
+        return bisect_left(self.keys, key) + 1
+
+    def top(self, k: int) -> List[Tuple[int, int]]:
+        """(key, bid) of the k strongest hands, strongest first"""
+        return [(self.keys[i], self.bids[i]) for i in range(len(self) - 1, max(len(self) - k, 0) - 1, -1)]
 
 # part one
 def part_one(hands: List[Hand]):
     """Solution to part one"""
-    return sum([(r+1) * hand.bid for r, hand in enumerate(sorted(hands))])
+    return winnings((hand.key, hand.bid) for hand in hands)
 
 # part two
-def part_two(hands: List[Hand2]):
+def part_two(hands: List[Hand]):
     """Solution to part two"""
-    return sum([(r+1) * hand.bid for r, hand in enumerate(sorted(hands))])
+    return winnings((hand.joker_key, hand.bid) for hand in hands)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(HANDS)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -118,12 +176,35 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two([Hand2(h.cards, h.bid) for h in HANDS])
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
     print(f":: total runtime: {t1+t2: .4f}s ::")
 
 
+def main_file(path: str):
+    """Both answers for a large set of hands on disk"""
+    print(f":: Advent of Code 2023 -- Day {day} ::")
+    answers = []
+    t = -time.time()
+    for jokers in (False, True):
+        with open(path, encoding="utf8") as f:
+            answers.append(Ranking(keys(f, jokers)).winnings())
+    t += time.time()
+    print(":: Part One ::")
+    print(f"Answer: {answers[0]}")
+    print(":: Part Two ::")
+    print(f"Answer: {answers[1]}")
+    print(f":: total runtime: {t: .4f}s ::")
+
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        import argparse
+        parser = argparse.ArgumentParser(description="Rank a large set of hands with a counting sort")
+        parser.add_argument("path")
+        args = parser.parse_args()
+        main_file(args.path)
+    else:
+        main()
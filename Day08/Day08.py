@@ -1,87 +1,123 @@
 """AoC :: Day 8"""
+from array import array
+from dataclasses import dataclass, field
 import math
+import os
 import re
+import sys
 import time
-from typing import Dict, List, Literal
+from typing import Iterator, List, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
+from graph import Graph  # pylint: disable=wrong-import-position
 day = 8
 
 
 # Parse inputs
-class Node:
-    """
-    A node within the network
-    
-    N.B Node holds a global map of the network as new nodes are added
+re_node = re.compile(r"(\w{3}) = \((\w{3}), (\w{3})\)")
+
+def turns(instructions: str) -> list[int]:
+    """the out-edge to follow (0 for left, 1 for right) for each instruction"""
+    for direction in instructions:
+        if direction not in "LR":
+            raise ValueError(f"direction must be 'L' or 'R', got {direction}")
+    return [direction == "R" for direction in instructions]
+
+def compile_network(network: Graph) -> Tuple[array, array]:
+    """the left and right node of every node, as two int arrays"""
+    offsets, targets = network.offsets, network.targets
+    left = array('i', (targets[offsets[v]] for v in range(len(network))))
+    right = array('i', (targets[offsets[v] + 1] for v in range(len(network))))
+    return left, right
+
+@dataclass
+class Documents:
     """
-    # Global network
-    network: Dict[str, "Node"] = {}
-
-    def __init__(self, name: str, left: str, right: str):
-        self.name = name
-        self._left = left
-        self._right = right
-        # Add Node to global network
-        self.network[name] = self
-        # To aide with part two
-        self.ghost_terminus = self.name[2] == "Z"
-
-    @property
-    def left(self):
-        """return the left node"""
-        return self.network[self._left]
-
-    @property
-    def right(self):
-        """return the left node"""
-        return self.network[self._right]
-
-    def __str__(self):
-        return f"Node[{self.name} = ({self._left}, {self._right})]"
-
-    def __repr__(self):
-        return str(self)
-
-    def __call__(self, direction: Literal["L", "R"]):
-        match direction:
-            case "L":
-                return self.left
-            case "R":
-                return self.right
-            case _:
-                raise ValueError(f"direction must be 'L' or 'R', got {direction}")
+    The instructions, the network, and where a full pass of the instructions leads
 
+    jump[v] is the node reached from v after following every instruction
+    once, and hits[v] is the (step, node) of each ghost terminal (a name
+    ending in Z) reached along the way, with steps counted from 1. Walks
+    then cover a whole pass per lookup. Building the table follows every
+    node through the instructions at once.
+    """
+    instructions: str
+    network: Graph
+    jump: array = field(init=False, repr=False)
+    hits: List[Tuple[Tuple[int, int], ...]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        left, right = compile_network(self.network)
+        moves = (left, right)
+        ghost_terminus = bytes(name[2] == "Z" for name in self.network.names)
+        nodes = list(range(len(self.network)))
+        hits = [[] for _ in nodes]
+        for j, step in enumerate(turns(self.instructions), 1):
+            move = moves[step]
+            nodes = [move[v] for v in nodes]
+            for v, node in enumerate(nodes):
+                if ghost_terminus[node]:
+                    hits[v].append((j, node))
+        self.jump = array('i', nodes)
+        self.hits = [tuple(h) for h in hits]
+
+    def terminals(self, node: int) -> Iterator[Tuple[int, int]]:
+        """
+        (steps, node) for each ghost terminal reached walking from a node, in order
+
+        Raises a ValueError if the walk settles into a loop of passes that
+        never reaches a ghost terminal.
+        """
+        N = len(self.instructions)
+        i = 0
+        # pass starts since the last ghost terminal
+        seen = set()
+        while True:
+            if self.hits[node]:
+                seen.clear()
+                for j, terminal in self.hits[node]:
+                    yield i + j, terminal
+            elif node in seen:
+                raise ValueError("This walk never reaches a ghost terminal")
+            else:
+                seen.add(node)
+            node = self.jump[node]
+            i += N
+
+def parse_input(text: str) -> Documents:
+    """
+    parse the instructions and the network of nodes
 
-re_node = re.compile(r"(\w{3}) = \((\w{3}), (\w{3})\)")
-with open('Day08/Day08.in', encoding="utf8") as f:
-    INSTRUCTIONS, map_string = f.read().split("\n\n")
-    INIT_NODE = None
-    TERMINAL_NODE = None
-    for row in map_string[:-1].split("\n"):
-        n = Node(*re_node.match(row).groups())
-        if n.name == "AAA":
-            INIT_NODE = n
-        if n.name == "ZZZ":
-            TERMINAL_NODE = n
-
-if INIT_NODE is None:
-    raise ValueError("Initial node AAA is missing from inputs")
-if TERMINAL_NODE is None:
-    raise ValueError("Terminal node ZZZ is missing from inputs")
+    Every node has two out-edges in the network, left then right.
+    """
+    instructions, map_string = text.split("\n\n")
+    network = Graph()
+    for row in map_string.splitlines():
+        name, left, right = re_node.match(row).groups()
+        network.add_edge(name, left)
+        network.add_edge(name, right)
+
+    if "AAA" not in network:
+        raise ValueError("Initial node AAA is missing from inputs")
+    if "ZZZ" not in network:
+        raise ValueError("Terminal node ZZZ is missing from inputs")
+    if any(network.degree(v) != 2 for v in range(len(network))):
+        raise ValueError("Every node needs exactly one left and one right")
+    return Documents(instructions.strip(), network)
 
 
 # part one
-def part_one(instructions: str, node: Node, terminus: Node):
+def part_one(documents: Documents):
     """Solution to part one"""
-    i = 0
-    N = len(instructions)
-    while node != terminus:
-        instruction = instructions[i % N]
-        node = node(instruction)
-        i += 1
-    return i
+    network = documents.network
+    terminus = network.id("ZZZ")
+    for steps, node in documents.terminals(network.id("AAA")):
+        if node == terminus:
+            return steps
+    raise ValueError("ZZZ can't be reached from AAA")
 
 # part two
-def part_two(instructions: str, nodes: List[Node]):
+def part_two(documents: Documents):
     """
     Solution to part two
     
@@ -89,36 +125,26 @@ def part_two(instructions: str, nodes: List[Node]):
     which is not necessarily guaranteed. Thus, it checks this condition is met and
     raises a ValueError if it fails on your particular instructions.
     """
-    N = len(instructions)
+    nodes = [v for v, name in enumerate(documents.network.names) if name[2] == "A"]
     ghost_terminals = []
     for node in nodes:
-        j = 0
-        t = -1
-        terminated = False
-        while True:
-            instruction = instructions[j % N]
-            node = node(instruction)
-            j += 1
-            if node.ghost_terminus:
-                if not terminated:
-                    t = j
-                    terminated = True
-                else:
-                    if t != j - t:
-                        raise ValueError("Using math.lcm won't work with these inputs, good luck")
-                    ghost_terminals.append(t)
-                    break
+        walk = documents.terminals(node)
+        (t, _), (j, _) = next(walk), next(walk)
+        if t != j - t:
+            raise ValueError("Using math.lcm won't work with these inputs, good luck")
+        ghost_terminals.append(t)
     return math.lcm(*ghost_terminals)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(INSTRUCTIONS, INIT_NODE, TERMINAL_NODE)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -126,7 +152,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(INSTRUCTIONS, [node for name, node in Node.network.items() if name[2] == "A"])
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -1,6 +1,10 @@
 """AoC :: Day 9"""
+import os
+import sys
 import time
 from typing import List
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 9
 
 
@@ -8,8 +12,10 @@ day = 9
 def parse(row: str):
     """parse a history row into a list of integers"""
     return [int(n) for n in row.split(" ")]
-with open('Day09/Day09.in', encoding="utf8") as f:
-    HISTORIES = [parse(i[:-1]) for i in f.readlines()]
+
+def parse_input(text: str) -> List[List[int]]:
+    """parse every history"""
+    return [parse(i) for i in text.splitlines()]
 
 
 # part one
@@ -27,16 +33,22 @@ def part_one(histories: List[List[int]]):
 
     return sum(recurse(h) for h in histories)
 
+# part two
+def part_two(histories: List[List[int]]):
+    """Solution to part two (part one on the reversed histories)"""
+    return part_one([h[::-1] for h in histories])
+
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(HISTORIES)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -44,7 +56,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_one([h[::-1] for h in HISTORIES])
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -1,162 +1,98 @@
 """AoC :: Day 10"""
-from enum import Enum
-from dataclasses import dataclass
+import os
+import sys
 import time
-from typing import Dict, List, Literal
+from typing import Dict, List, Literal, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
+from directions import DIRECTIONS, DOWN, LEFT, REVERSE, RIGHT, UP  # pylint: disable=wrong-import-position
+from grid import OFF_GRID, Grid  # pylint: disable=wrong-import-position
 day = 10
 
 # parse inputs
 PIPE = Literal["|", "-", "L", "J", "7", "F"]
-class Direction(Enum):
-    """Directions most naturally live on the Gaussian Integers"""
-    UP:    complex = -1j
-    DOWN:  complex = 1j
-    RIGHT: complex = 1 + 0j
-    LEFT:  complex = -1 + 0j
-
-    def __neg__(self):
-        """flip a direction"""
-        return Direction(-self.value)
-
-@dataclass
-class PipeMovement:
-    """Encode how a pipe affects movement"""
-    exit1: Direction
-    exit2: Direction
-
-    def __call__(self, item: Direction) -> Direction:
-        if -item is self.exit1:
-            return self.exit2
-        if -item is self.exit2:
-            return self.exit1
-        raise KeyError(f"invalid movement {item}, can only accept {-self.exit1} or {-self.exit2} for this pipe")
-
-    def __eq__(self, other: "PipeMovement"):
-        if self.exit1 is other.exit1:
-            if self.exit2 is other.exit2:
-                return True
-        elif self.exit1 is other.exit2:
-            if self.exit2 is other.exit1:
-                return True
-        return False
-
-class Pipe:
-    """The representation of a pipe within the maze"""
-    # How pipes correspond to exits
-    EXITS: Dict[PIPE, PipeMovement] = {
-        "|": PipeMovement(Direction.UP, Direction.DOWN),
-        "L": PipeMovement(Direction.UP, Direction.RIGHT),
-        "J": PipeMovement(Direction.UP, Direction.LEFT),
-        "F": PipeMovement(Direction.DOWN, Direction.RIGHT),
-        "7": PipeMovement(Direction.DOWN, Direction.LEFT),
-        "-": PipeMovement(Direction.RIGHT, Direction.LEFT),
-    }
-
-    def __init__(self, kind: PIPE):
-        self.kind: Pipe = kind
-
-    @property
-    def directions(self) -> PipeMovement:
-        """the directions you can move out from this pipe"""
-        return self.EXITS[self.kind]
-
-    def __call__(self, direction_in: Direction) -> Direction:
-        return self.EXITS[self.kind](direction_in)
-
-
-@dataclass
-class Position:
-    """A position in the maze"""
-    row: int
-    col: int
-
-    def valid(self) -> PipeMovement:
+# How pipes correspond to exits
+EXITS: Dict[PIPE, Tuple[int, int]] = {
+    "|": (UP, DOWN),
+    "L": (UP, RIGHT),
+    "J": (UP, LEFT),
+    "F": (DOWN, RIGHT),
+    "7": (DOWN, LEFT),
+    "-": (RIGHT, LEFT),
+}
+
+# TURNS entry for a tile that can't be entered on a heading
+NO_EXIT = 255
+
+def pipe_turns() -> bytes:
+    """
+    How each tile turns a walker, by tile byte and heading
+
+    turns[4 * tile + heading] is the heading out of the tile when entering it
+    on heading, or NO_EXIT if the tile doesn't connect back that way.
+    """
+    turns = bytearray([NO_EXIT]) * (4 * 256)
+    for kind, (exit1, exit2) in EXITS.items():
+        turns[4 * ord(kind) + REVERSE[exit1]] = exit2
+        turns[4 * ord(kind) + REVERSE[exit2]] = exit1
+    return bytes(turns)
+
+TURNS = pipe_turns()
+
+
+class Maze(Grid):
+    """the field of pipes"""
+    def valid(self, position: int) -> Tuple[int, ...]:
         """return the directions from this position that will lead to a pipe"""
-        # MAZE.get(self(direction)) returns None if it isn't a pipe
-        valid = []
-        for direction in Direction:
-            try:
-                MAZE[self(direction)](direction)
-                valid.append(direction)
-            except KeyError:
-                pass
-        print(valid)
-        return PipeMovement(exit1=valid[0], exit2=valid[1])
-
-    def __eq__(self, other: "Position"):
-        return (self.row == other.row) and (self.col == other.col)
-
-    def __hash__(self):
-        return hash((self.row, self.col, "Position"))
-
-    def __call__(self, direction: Direction) -> "Position":
-        gaussian_pos = self.col + self.row * 1j
-        new_pos = gaussian_pos + direction.value
-        return Position(int(new_pos.imag), int(new_pos.real))
-
-    @property
-    def pipe(self) -> "Pipe":
-        """Return the pipe from the Maze at this position"""
-        return MAZE[self]
-
-MAZE: Dict[Position, Pipe] = {}
-
-def parse(row: int, string: str):
-    """insert pipes into MAZE"""
-    start = None
-    for col, character in enumerate(string):
-        if character == "S":
-            start = Position(row, col)
-        elif character not in (".", "\n"):
-            pos = Position(row, col)
-            MAZE[pos] = Pipe(character)
-    return start
-
-with open('Day10/Day10.in', encoding="utf8") as f:
-    for r, s in enumerate(f.readlines()):
-        p = parse(r, s)
-        if p:
-            START = p
-
-# Insert correct pipe into Maze start square
-# This will help to figure out the starting direction and then
-# we only need the position and direction, and we've abstracted
-# the pipe away from movement
-if START:
-    v = START.valid()
-    print(f"v = {v}")
-    for char in ["|", "-", "L", "J", "7", "F"]:
-        if Pipe(char).directions == v:
-            print(f"starting pipe char: {char}")
-            print()
-            MAZE[START] = Pipe(char)
-else:
-    raise ValueError("There is no starting tile 'S' in the maze provided")
+        return tuple(
+            direction for direction in DIRECTIONS
+            if (neighbour := self.move(position, direction)) != OFF_GRID
+            and TURNS[4 * self[neighbour] + direction] != NO_EXIT
+        )
+
+def parse_input(text: str) -> Tuple[Maze, int]:
+    """parse the maze and its starting position"""
+    maze = Maze.parse(text)
+    start = maze.find("S")
+
+    # Insert correct pipe into Maze start square
+    # This will help to figure out the starting direction and then
+    # we only need the position and direction, and we've abstracted
+    # the pipe away from movement
+    if start == OFF_GRID:
+        raise ValueError("There is no starting tile 'S' in the maze provided")
+    v = set(maze.valid(start))
+    for char, exits in EXITS.items():
+        if set(exits) == v:
+            maze[start] = char
+    return maze, start
 
 # part one
-def part_one(start: Position):
-    """
-    Solution to part one
-    
-    return the positions the loop takes in the maze for part two
-    """
+def loop(maze: Maze, start: int):
+    """return the positions the loop takes in the maze"""
+    moves = maze.moves
+    cells = maze.cells
     # Init counter, position and direction
     position = start
-    direction = position.pipe.directions.exit1
+    direction = EXITS[chr(cells[position])][0]
     # store all the loop positions
-    loop_positions: List[Position] = []
+    loop_positions: List[int] = []
     # Walk around maze until we're back where we started
     while True:
         # Update position and direction
-        position = position(direction)
-        direction = position.pipe(direction)
+        position = moves[4 * position + direction]
+        direction = TURNS[4 * cells[position] + direction]
         loop_positions.append(position)
         if position == start:
             break
-    return len(loop_positions)//2, loop_positions
+    return loop_positions
+
+def part_one(inputs: Tuple[Maze, int]):
+    """Solution to part one"""
+    return len(loop(*inputs))//2
 
 # part two
-def part_two(positions: List[Position]):
+def part_two(inputs: Tuple[Maze, int]):
     """
     Solution to part two
     
@@ -166,9 +102,12 @@ def part_two(positions: List[Position]):
 
     See: https://en.wikipedia.org/wiki/Shoelace_formula for more maths
     """
-    def determinant(p1: Position, p2: Position):
+    maze, _ = inputs
+    positions = [maze.coords(i) for i in loop(*inputs)]
+
+    def determinant(p1: Tuple[int, int], p2: Tuple[int, int]):
         """return the determinant as per the shoelace formula"""
-        return (p1.col * p2.row) - (p1.row * p2.col)
+        return (p1[1] * p2[0]) - (p1[0] * p2[1])
     # the inner sum is signed based on the direction of the loop (i.e. using the right hand rule)
     # it also calculates twice the area so divide by two
     area = abs(
@@ -180,14 +119,15 @@ def part_two(positions: List[Position]):
     return area - girth
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1, positions = part_one(START)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -195,7 +135,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(positions)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
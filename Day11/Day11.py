@@ -1,7 +1,11 @@
 """AoC :: Day 11"""
 from dataclasses import dataclass
+import os
+import sys
 import time
 from typing import List, Set
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 11
 
 
@@ -12,44 +16,51 @@ class Galaxy:
     row: int
     col: int
 
-    def distance(self, other: "Galaxy", scaling_factor: int = 1):
-        """the expanded distance between galaxies"""
+    def distance(self, other: "Galaxy", rows: Set[int], cols: Set[int], scaling_factor: int = 1):
+        """the expanded distance between galaxies given the rows and cols that contain galaxies"""
         # Expansion along rows
         row_exp_start, row_exp_end = sorted([self.row, other.row])
-        row_exp = len(set(range(row_exp_start, row_exp_end + 1)) - ROWS) * (scaling_factor - 1)
+        row_exp = len(set(range(row_exp_start, row_exp_end + 1)) - rows) * (scaling_factor - 1)
         # Expansion along cols
         col_exp_start, col_exp_end = sorted([self.col, other.col])
-        col_exp = len(set(range(col_exp_start, col_exp_end + 1)) - COLS) * (scaling_factor - 1)
+        col_exp = len(set(range(col_exp_start, col_exp_end + 1)) - cols) * (scaling_factor - 1)
         return abs(self.row - other.row) + abs(self.col - other.col) + row_exp + col_exp
 
 def parse(row: int, string: str) -> Set[Galaxy]:
     """Parse string into a set of Galaxies"""
     return [Galaxy(row, col) for col, char in enumerate(string) if char == "#"]
 
-GALAXIES: List[Galaxy] = []
-with open('Day11/Day11.in', encoding="utf8") as f:
-    for r, s in enumerate(f.readlines()):
-        GALAXIES += parse(r, s)
-
-# Populate the rows and columns
-ROWS, COLS = {g.row for g in GALAXIES}, {g.col for g in GALAXIES}
+def parse_input(text: str) -> List[Galaxy]:
+    """Parse the image into its Galaxies"""
+    galaxies: List[Galaxy] = []
+    for r, s in enumerate(text.splitlines()):
+        galaxies += parse(r, s)
+    return galaxies
 
 # part one
 def part_one(galaxies: List[Galaxy], scaling_factor: int = 1):
     """Solution to part one"""
+    # Populate the rows and columns
+    rows, cols = {g.row for g in galaxies}, {g.col for g in galaxies}
     return sum(
-        g1.distance(g2, scaling_factor) for i, g1 in enumerate(galaxies) for g2 in galaxies[i+1:]
+        g1.distance(g2, rows, cols, scaling_factor) for i, g1 in enumerate(galaxies) for g2 in galaxies[i+1:]
     )
 
+# part two
+def part_two(galaxies: List[Galaxy]):
+    """Solution to part two"""
+    return part_one(galaxies, scaling_factor = 1_000_000)
+
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(GALAXIES)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -57,7 +68,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_one(GALAXIES, scaling_factor = 1_000_000)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -8,8 +8,12 @@ which is where I got the code for the automata function below.
 """
 from enum import Enum
 from dataclasses import dataclass
+import os
+import sys
 import time
 from typing import List
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 12
 
 class Condition(Enum):
@@ -39,8 +43,9 @@ def parse(row: str):
         record = [int(i) for i in record.split(",")]
     )
 
-with open('Day12/Day12.in', encoding="utf8") as f:
-    ROWS = [parse(row) for row in f.readlines()]
+def parse_input(text: str) -> List[Row]:
+    """parse every row"""
+    return [parse(row) for row in text.splitlines()]
 
 # part one
 def automata(row: Row):
@@ -85,14 +90,15 @@ def part_two(rows: List[Row]):
     return sum(automata(row.unfold()) for row in rows)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(ROWS)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -100,7 +106,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(ROWS)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -1,5 +1,9 @@
 """AoC :: Day 13"""
+import os
+import sys
 import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 13
 
 
@@ -65,9 +69,10 @@ class Pattern(list[int]):
         raise ValueError("no axis of reflection found")
 
 
-with open('Day13/Day13.in', encoding="utf8") as f:
-    PATTERNS = [
-        Pattern(p.split("\n")) for p in f.read().split("\n\n")
+def parse_input(text: str) -> list[Pattern]:
+    """parse every pattern"""
+    return [
+        Pattern(p.split("\n")) for p in text.split("\n\n")
     ]
 
 # part one
@@ -75,15 +80,21 @@ def part_one(patterns: list[Pattern], smudges: int = 0):
     """Solution to part one & two"""
     return sum(pattern.summarize(smudges=smudges) for pattern in patterns)
 
+# part two
+def part_two(patterns: list[Pattern]):
+    """Solution to part two"""
+    return part_one(patterns, smudges=1)
+
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(PATTERNS)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -91,7 +102,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_one(PATTERNS, smudges=1)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
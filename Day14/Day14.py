@@ -1,96 +1,88 @@
 """AoC :: Day 14"""
-from dataclasses import dataclass
+import os
+import sys
 import time
-from typing import Literal
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
+from directions import DOWN, LEFT, RIGHT, UP  # pylint: disable=wrong-import-position
+from grid import Grid  # pylint: disable=wrong-import-position
 day = 14
 
 # parse inputs
-@dataclass
-class Rock:
-    """represents a rock on a grid"""
-    kind: Literal["#", "O"]
-    row: int
-    col: int
+ROUND = ord("O")
 
-with open('Day14/Day14.in', encoding="utf8") as f:
-    GRID: dict[int, list[Rock]] = {}
-    N = 0 # Prevents N being unbound
-    for r, string in enumerate(f.readlines()):
-        N = r + 1
-        for c, char in enumerate(string):
-            if char in ("#", "O"):
-                GRID.setdefault(c, []).append(Rock(char, r, c))
-
-# HELPER FUNCTION
-def hash_grid(grid: dict[int, list[Rock]]):
-    """helper function to hash grid"""
-    return '\n'.join([''.join(rock.kind for rock in rocks) for _, rocks in grid.items()])
+def parse_input(text: str) -> Grid:
+    """parse the platform of rounded (O) and cube (#) rocks"""
+    return Grid.parse(text)
 
 # part one
-def part_one(grid: dict[int, list[Rock]]):
+def tilt(platform: Grid, direction: int = UP):
+    """
+    Tilt the platform in place so that every rounded rock rolls as far as it can
+
+    Each row or column splits on the cube rocks into runs that the rounded
+    rocks pack into one end of, so a tilt is done with bytes operations.
+    """
+    cells, w, h = platform.cells, platform.width, platform.height
+    if direction in (UP, DOWN):
+        lines = [slice(col, None, w) for col in range(w)]
+    else:
+        lines = [slice(row * w, (row + 1) * w) for row in range(h)]
+    forwards = direction in (UP, LEFT)
+    for line in lines:
+        runs = []
+        for run in cells[line].split(b"#"):
+            rocks = run.count(b"O")
+            rolled = b"O" * rocks, b"." * (len(run) - rocks)
+            runs.append(b"".join(rolled if forwards else reversed(rolled)))
+        cells[line] = b"#".join(runs)
+
+def north_load(platform: Grid):
+    """the total load on the north support beams"""
+    w, h = platform.width, platform.height
+    return sum(h - i // w for i, cell in enumerate(platform.cells) if cell == ROUND)
+
+def part_one(platform: Grid):
     """Solution to part one"""
-    new_grid: dict[int, list[Rock]] = {}
-    total = 0
-    for col, rocks in grid.items():
-        load = N
-        for rock in sorted(rocks, key=lambda x: x.row):
-            match rock.kind:
-                case "#":
-                    load = N - rock.row
-                    new_grid.setdefault(load-1, []).append(Rock("#", col, load-1))
-                    load -= 1
-                case "O":
-                    total += load
-                    new_grid.setdefault(load-1, []).append(Rock("O", col, load-1))
-                    load -= 1
-    return total, new_grid
+    platform = platform.copy()
+    tilt(platform, UP)
+    return north_load(platform)
 
 # part two
-def load_no_slide(grid: dict[int, list[Rock]]):
-    """Do part one without sliding"""
-    total = 0
-    for _, rocks in grid.items():
-        for rock in rocks:
-            match rock.kind:
-                case "#":
-                    pass
-                case "O":
-                    total += N - rock.row
-    return total
-
-def part_two(grid: dict[int, list[Rock]], n: int = 1_000_000_000):
+def part_two(platform: Grid, n: int = 1_000_000_000):
     """Solution to part two"""
-    def cycle(grid: dict[int, list[Rock]]):
-        for _ in range(4):
-            _, grid = part_one(grid)
-        return _, grid
+    platform = platform.copy()
+
+    def cycle():
+        for direction in (UP, LEFT, DOWN, RIGHT):
+            tilt(platform, direction)
 
-    cache = {}
+    # the cycle each arrangement was first seen after
+    cache: dict[bytes, int] = {}
     i = 0
-    cycle_detected = False
     while i < n:
-        _, grid = cycle(grid)
-        if not cycle_detected:
-            s = hash_grid(grid)
-            if (s not in cache) and (not cycle_detected):
-                cache[s] = i
-            elif (s in cache) and (not cycle_detected):
-                cycle_length = i - cache[s]
-                m = (n - i)//cycle_length
-                i += m * cycle_length
-                cycle_detected = True
+        cycle()
         i += 1
-    return load_no_slide(grid)
+        s = bytes(platform.cells)
+        if s in cache:
+            # skip as many whole loops as still fit
+            cycle_length = i - cache[s]
+            i += (n - i) // cycle_length * cycle_length
+            cache.clear()
+        else:
+            cache[s] = i
+    return north_load(platform)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1, _ = part_one(GRID)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -98,7 +90,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(GRID)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
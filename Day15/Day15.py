@@ -1,7 +1,11 @@
 """AoC :: Day 15"""
 from dataclasses import dataclass
+import os
+import sys
 import time
 from typing import Dict, Literal, Optional
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 15
 
 
@@ -75,9 +79,9 @@ def parse(s: str):
         return Instruction(s[:-1], "-")
     raise ValueError(f"{s} is not a valid Instruction")
 
-with open('Day15/Day15.in', encoding="utf8") as f:
-    inputs = f.read()[:-1].split(",")
-    INSTRUCTIONS = [parse(i) for i in inputs]
+def parse_input(text: str) -> list[str]:
+    """split the initialization sequence into its steps"""
+    return text.strip().split(",")
 
 # part one
 def part_one(args: list[str]):
@@ -85,15 +89,17 @@ def part_one(args: list[str]):
     return sum(HASH.algorithm(arg) for arg in args)
 
 # part two
-def part_two(instructions: list[Instruction]):
+def part_two(args: list[str]):
     """Solution to part two"""
+    instructions = [parse(arg) for arg in args]
     h = HASH()
     h.do(instructions)
     return h.focusing_power()
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
@@ -107,7 +113,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(INSTRUCTIONS)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -1,142 +1,85 @@
 """AoC :: Day 16"""
-from enum import Enum
+import os
+import sys
 import time
-from typing import Dict, Set, Tuple
+from typing import Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
+from directions import DOWN, LEFT, REFLECT, RIGHT, SPLIT, STRAIGHT, UP  # pylint: disable=wrong-import-position
+from grid import OFF_GRID, Grid  # pylint: disable=wrong-import-position
 day = 16
 
 
 # parse inputs
-class Direction(Enum):
-    """the different directions of travel"""
-    UP    = 1j
-    LEFT  = -1+0j
-    DOWN  = -1j
-    RIGHT = 1+0j
+def beam_headings() -> list[tuple[tuple[int, ...], ...]]:
+    """the headings a beam leaves a tile on, by tile byte then the heading it entered on"""
+    headings = [STRAIGHT] * 256
+    for kind, reflections in REFLECT.items():
+        headings[ord(kind)] = tuple((d,) for d in reflections)
+    for kind, splits in SPLIT.items():
+        headings[ord(kind)] = splits
+    return headings
 
-    def __radd__(self, other: complex):
-        return other + self.value
+HEADINGS = beam_headings()
 
-class Mirror(Enum):
-    """the different mirror types"""
-    FORWARD_SLASH = "/"
-    BACK_SLASH    = "\\"
 
-    def move(self, position: complex, direction: Direction):
-        """the resulting movements of a beam"""
-        match self:
-            case Mirror.FORWARD_SLASH:
-                match direction:
-                    case Direction.UP:
-                        return [(position + Direction.RIGHT, Direction.RIGHT)]
-                    case Direction.LEFT:
-                        return [(position + Direction.DOWN, Direction.DOWN)]
-                    case Direction.DOWN:
-                        return [(position + Direction.LEFT, Direction.LEFT)]
-                    case Direction.RIGHT:
-                        return [(position + Direction.UP, Direction.UP)]
-            case Mirror.BACK_SLASH:
-                match direction:
-                    case Direction.UP:
-                        return [(position + Direction.LEFT, Direction.LEFT)]
-                    case Direction.LEFT:
-                        return [(position + Direction.UP, Direction.UP)]
-                    case Direction.DOWN:
-                        return [(position + Direction.RIGHT, Direction.RIGHT)]
-                    case Direction.RIGHT:
-                        return [(position + Direction.DOWN, Direction.DOWN)]
-
-class Splitter(Enum):
-    """the different splitter types"""
-    VERTICAL      = "|"
-    HORIZONTAL    = "-"
-
-    def move(self, position: complex, direction: Direction):
-        """the resulting movements of a beam"""
-        match self:
-            case Splitter.VERTICAL:
-                if direction in (Direction.UP, Direction.DOWN):
-                    return [(position + direction, direction)]
-                return [(position + Direction.UP, Direction.UP), (position + Direction.DOWN, Direction.DOWN)]
-            case Splitter.HORIZONTAL:
-                if direction in (Direction.LEFT, Direction.RIGHT):
-                    return [(position + direction, direction)]
-                return [(position + Direction.LEFT, Direction.LEFT), (position + Direction.RIGHT, Direction.RIGHT)]
-
-
-class Contraption:
+class Contraption(Grid):
     """a contraption with mirrors and splitters"""
-    def __init__(self, width: int = None, height: int = None):
-        self.width = width
-        self.height = height
-        self.grid: Dict[complex, Mirror | Splitter] = {}
-
-    def move(self, position: complex, direction: Direction):
-        """determine the next step of a beam"""
-        if position in self.grid:
-            obj = self.grid[position]
-            return obj.move(position, direction)
-        return [(position + direction.value, direction)]
-
-    def valid(self, position: complex):
-        """test that a beam is in bounds"""
-        return (0 <= position.real < self.width) and (0 <= position.imag < self.height)
-
-    def __call__(self, beam: Tuple[complex, Direction] = (0+0j, Direction.LEFT)):
-        beams: Set[Tuple[complex, Direction]] = {beam}
-        curr_beams = [beam]
-        while curr_beams:
-            new_beams = []
-            for position, direction in curr_beams:
-                for n in self.move(position, direction):
-                    if self.valid(n[0]) and (n not in beams):
-                        beams.add(n)
-                        new_beams.append(n)
-            curr_beams = new_beams
-        return len({pos for pos, _ in beams})
-
-with open('Day16/Day16.in', encoding="utf8") as f:
-    inputs = [i[:-1] for i in f.readlines()]
-    WIDTH = len(inputs[0])
-    HEIGHT = len(inputs)
-    CONTRAPTION = Contraption(width=WIDTH, height=HEIGHT)
-    for row, string in enumerate(inputs):
-        for col, char in enumerate(string):
-            pos = complex(col, HEIGHT - row - 1)
-            if char in ("/", "\\"):
-                CONTRAPTION.grid[pos] = Mirror(char)
-            elif char in ("|", "-"):
-                CONTRAPTION.grid[pos] = Splitter(char)
-
-    INIT_BEAM = (complex(0, HEIGHT - 1), Direction.RIGHT)
+    def __call__(self, beam: Tuple[int, int] = (0, RIGHT)):
+        moves, cells = self.moves, self.cells
+        # flags for each beam state (4 * position + heading), and each energised position
+        beams = bytearray(4 * len(self))
+        energised = bytearray(len(self))
+        position, heading = beam
+        beams[4 * position + heading] = energised[position] = 1
+        stack = [4 * position + heading]
+        while stack:
+            state = stack.pop()
+            position = state >> 2
+            for heading in HEADINGS[cells[position]][state & 3]:
+                new_position = moves[4 * position + heading]
+                if new_position == OFF_GRID:
+                    continue
+                new_state = 4 * new_position + heading
+                if not beams[new_state]:
+                    beams[new_state] = energised[new_position] = 1
+                    stack.append(new_state)
+        return energised.count(1)
+
+def parse_input(text: str) -> Contraption:
+    """parse the mirrors and splitters into a contraption"""
+    return Contraption.parse(text)
 
 
 # part one
-def part_one(beam: Tuple[complex, Direction], contraption: Contraption = CONTRAPTION):
+def part_one(contraption: Contraption, beam: Tuple[int, int] = None):
     """Solution to part one"""
+    if beam is None:
+        # Enter the top left corner heading right
+        beam = (0, RIGHT)
     return contraption(beam)
 
 # part two
-def part_two(contraption: Contraption = CONTRAPTION):
+def part_two(contraption: Contraption):
     """Solution to part two"""
-    right = complex(contraption.width - 1, 0)
-    top = complex(0, contraption.height - 1)
     beams = (
-        [(h*1j, Direction.RIGHT) for h in range(contraption.height)] +
-        [(right + h*1j, Direction.LEFT) for h in range(contraption.height)] +
-        [(w + 0j, Direction.UP) for w in range(contraption.width)] +
-        [(w + top, Direction.DOWN) for w in range(contraption.width)]
+        [(i, RIGHT) for i in contraption.edge(LEFT)] +
+        [(i, LEFT) for i in contraption.edge(RIGHT)] +
+        [(i, UP) for i in contraption.edge(DOWN)] +
+        [(i, DOWN) for i in contraption.edge(UP)]
     )
     return max(contraption(beam) for beam in beams)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(INIT_BEAM)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -144,7 +87,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two()
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -1,136 +1,104 @@
 """AoC :: Day 17"""
-from dataclasses import dataclass, field
-from enum import Enum
-from queue import PriorityQueue
+from array import array
+from heapq import heappop, heappush
+import os
+import sys
 import time
-from typing import Dict
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
+from directions import DIRECTIONS, TURN_LEFT, TURN_RIGHT  # pylint: disable=wrong-import-position
+from grid import OFF_GRID, Grid  # pylint: disable=wrong-import-position
 day = 17
 
 
-class Direction(Enum):
-    """the different directions of travel"""
-    UP    = 1j
-    LEFT  = -1+0j
-    DOWN  = -1j
-    RIGHT = 1+0j
-
-    def __radd__(self, other: complex):
-        return other + self.value
-
-
-@dataclass(order=True)
-class Cursor:
-    """a cursor moving along the grid"""
-    loss: int
-    # State
-    position: complex = field(compare=False)
-    direction: Direction = field(compare=False)
-    # counts the number of times this direction has been travelled in
-    ctr: int = field(compare=False)
-
-    def valid(self, minimum: int = None, maximum: int = None) -> tuple[Direction, ...]:
-        """return valid next directions given a direction"""
-        if minimum and (self.ctr < minimum - 1):
-            return (self.direction,)
-        match self.direction:
-            case Direction.UP:
-                if self.ctr >= maximum - 1:
-                    return (Direction.LEFT, Direction.RIGHT)
-                return (Direction.LEFT, Direction.UP, Direction.RIGHT)
-            case Direction.LEFT:
-                if self.ctr >= maximum - 1:
-                    return (Direction.DOWN, Direction.UP)
-                return (Direction.DOWN, Direction.LEFT, Direction.UP)
-            case Direction.DOWN:
-                if self.ctr >= maximum - 1:
-                    return (Direction.RIGHT, Direction.LEFT)
-                return (Direction.RIGHT, Direction.DOWN, Direction.LEFT)
-            case Direction.RIGHT:
-                if self.ctr >= maximum - 1:
-                    return (Direction.UP, Direction.DOWN)
-                return (Direction.UP, Direction.RIGHT, Direction.DOWN)
-
-    def __hash__(self):
-        return hash((self.position, self.direction, self.loss))
-
-class Grid:
+# The headings a cursor may take next: keep going, turn or go straight, or must turn
+STRAIGHT_ON = tuple((d,) for d in DIRECTIONS)
+TURN_OR_STRAIGHT = tuple((TURN_LEFT[d], d, TURN_RIGHT[d]) for d in DIRECTIONS)
+TURN = tuple((TURN_LEFT[d], TURN_RIGHT[d]) for d in DIRECTIONS)
+
+
+class HeatLossMap(Grid):
     """a grid of values that determines heat loss"""
-    def __init__(self, height: int, width: int):
-        self.height = height
-        self.width = width
-        self.grid: Dict[complex, int] = {}
-
-    def __getitem__(self, item: complex):
-        return self.grid[item]
-
-    def valid(self, position: complex):
-        """check that a cursor is in a valid spot"""
-        return (0 <= position.real < self.width) and (0 <= position.imag < self.height)
-
-    def A_star(self, init: complex, terminus: complex, minimum: int = None, maximum: int = 3):
-        """do A* on the grid"""
-        history: dict[tuple[complex, Direction], int] = {}
-        cursors = PriorityQueue()
-
-        for direction in Direction:
-            if self.valid(init + direction):
-                position = init + direction
-                history[(position, direction, 0)] = self[position]
-                cursors.put(Cursor(self[position], position, direction, 0))
+    def __init__(self, width: int, height: int, cells: bytes | bytearray = None):
+        super().__init__(width, height, cells)
+        # the heat loss of each cell, from its digit
+        self.loss = bytes(cell - ord("0") for cell in self.cells)
+
+    @property
+    def init(self):
+        """the top left corner"""
+        return 0
+
+    @property
+    def terminus(self):
+        """the bottom right corner"""
+        return len(self) - 1
+
+    def A_star(self, init: int, terminus: int, minimum: int = None, maximum: int = 3):
+        """
+        do A* on the grid
+
+        A cursor is (loss, position, heading, ctr) where ctr counts the steps
+        taken on this heading. The best loss seen for each cursor state is
+        kept in a flat array indexed by (4 * position + heading) * maximum + ctr.
+        """
+        moves, loss = self.moves, self.loss
+        unseen = 10 * len(self) * maximum
+        history = array('l', [unseen]) * (4 * len(self) * maximum)
+        cursors: list[tuple[int, int, int, int]] = []
+        # the cursor must keep going straight until this ctr
+        straight = (minimum or 0) - 1
+
+        for direction in DIRECTIONS:
+            if (position := moves[4 * init + direction]) != OFF_GRID:
+                history[(4 * position + direction) * maximum] = loss[position]
+                heappush(cursors, (loss[position], position, direction, 0))
         while True:
-            cursor = cursors.get_nowait()
-            cursor: Cursor
-            for direction in cursor.valid(minimum, maximum):
-                new_position = cursor.position + direction
+            cursor_loss, position, heading, ctr = heappop(cursors)
+            if ctr < straight:
+                headings = STRAIGHT_ON[heading]
+            elif ctr >= maximum - 1:
+                headings = TURN[heading]
+            else:
+                headings = TURN_OR_STRAIGHT[heading]
+            for direction in headings:
+                new_position = moves[4 * position + direction]
                 if new_position == terminus:
-                    return cursor.loss + self.grid[terminus]
-                if self.valid(new_position):
-                    new_ctr = (cursor.ctr + 1) if direction is cursor.direction else 0
-                    new_loss = cursor.loss + self.grid[new_position]
-                    if (new_position, direction, new_ctr) in history:
-                        if new_loss < history[(new_position, direction, new_ctr)]:
-                            history[(new_position, direction, new_ctr)] = new_loss
-                        else:
-                            continue
-                    else:
-                        history[(new_position, direction, new_ctr)] = new_loss
-                    cursors.put(
-                        Cursor(new_loss, new_position, direction, new_ctr)
-                    )
+                    return cursor_loss + loss[terminus]
+                if new_position != OFF_GRID:
+                    new_ctr = (ctr + 1) if direction == heading else 0
+                    new_loss = cursor_loss + loss[new_position]
+                    state = (4 * new_position + direction) * maximum + new_ctr
+                    if new_loss < history[state]:
+                        history[state] = new_loss
+                        heappush(cursors, (new_loss, new_position, direction, new_ctr))
 
 # parse inputs
-with open('Day17/Day17.in', encoding="utf8") as f:
-    inputs = [i[:-1] for i in f.readlines()]
-    HEIGHT = len(inputs)
-    WIDTH = len(inputs[0])
-    MAP = Grid(HEIGHT, WIDTH)
-    for row, string in enumerate(inputs):
-        for col, char in enumerate(string):
-            pos = complex(col, HEIGHT - row - 1)
-            MAP.grid[pos] = int(char)
-    INIT = complex(0, HEIGHT-1)
-    TERMINUS = complex(WIDTH-1, 0)
+def parse_input(text: str) -> HeatLossMap:
+    """parse the heat loss map"""
+    return HeatLossMap.parse(text)
 
 
 # part one
-def part_one(init: complex, terminus: complex, grid: Grid = MAP):
+def part_one(heat_map: HeatLossMap):
     """Solution to part one"""
-    return grid.A_star(init, terminus)
+    return heat_map.A_star(heat_map.init, heat_map.terminus)
 
 # part two
-def part_two(init: complex, terminus: complex, grid: Grid = MAP):
+def part_two(heat_map: HeatLossMap):
     """Solution to part two"""
-    return grid.A_star(init, terminus, 4, 10)
+    return heat_map.A_star(heat_map.init, heat_map.terminus, 4, 10)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(INIT, TERMINUS)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -138,7 +106,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(INIT, TERMINUS)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
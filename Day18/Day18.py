@@ -1,104 +1,92 @@
 """AoC :: Day 18"""
 from dataclasses import dataclass
-from enum import Enum
+import os
+import sys
 import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
+from directions import DCOL, DOWN, DROW, LEFT, LETTERS, RIGHT, UP  # pylint: disable=wrong-import-position
 day = 18
 
 
 # parse inputs
-class Direction(Enum):
-    """a cardinal direction"""
-    U = 1j
-    L = -1+0j
-    D = -1j
-    R = 1 + 0j
-
-    def __mul__(self, other: int):
-        return self.value * other
-
 @dataclass
 class Instruction:
     """an instruction including a direction, number of steps and a colour code"""
-    direction: Direction
+    direction: int
     steps: int
     code: str
     direction_decode = {
-        "0": Direction.R,
-        "1": Direction.D,
-        "2": Direction.L,
-        "3": Direction.U
+        "0": RIGHT,
+        "1": DOWN,
+        "2": LEFT,
+        "3": UP
     }
 
     @property
     def vector(self):
-        """The vector of travel"""
-        return self.direction * self.steps
+        """The (row, col) vector of travel"""
+        return DROW[self.direction] * self.steps, DCOL[self.direction] * self.steps
 
     @staticmethod
     def parse(string: str):
         """parse a row into an instruction"""
-        d, n, code = string.split(" ")
-        return Instruction(Direction[d], int(n), code[2:-2])
+        d, n, code = string.split()
+        return Instruction(LETTERS[d], int(n), code[2:-1])
 
     def decode(self):
         """decode for part two"""
         return Instruction(self.direction_decode[self.code[-1]], int(self.code[:-1], 16), self.code)
 
 
-with open('Day18/Day18.in', encoding="utf8") as f:
-    INSTRUCTIONS = [Instruction.parse(i) for i in f.readlines()]
+def parse_input(text: str) -> list[Instruction]:
+    """parse every instruction"""
+    return [Instruction.parse(i) for i in text.splitlines()]
 
 
 # part one
-def determinant(p1: complex, p2: complex):
-    """return the determinant as per the shoelace formula"""
-    return (p1.real * p2.imag) - (p1.imag * p2.real)
-
-def part_one(instructions: list[Instruction]):
+def dig(moves: list[tuple[int, int]]):
     """
-    Solution to part one
-    
-    Basically a direct copy from Day10
+    The number of cubes dug out by a trench of (direction, steps) moves
+
+    The shoelace formula gives the area inside the centre line of the trench,
+    then the half of the trench outside of it is added on. Basically a direct
+    copy from Day10
     """
     # init
-    position = 0+0j
+    row, col = 0, 0
     area = 0
     perimeter = 0
 
-    for instruction in instructions:
-        v = instruction.vector
-        area += determinant(position, position + v)
-        perimeter += instruction.steps
-        position += instruction.vector
+    for direction, steps in moves:
+        new_row, new_col = row + DROW[direction] * steps, col + DCOL[direction] * steps
+        # determinant as per the shoelace formula
+        area += col * new_row - row * new_col
+        perimeter += steps
+        row, col = new_row, new_col
     area = abs(area) // 2
-    return int(area + perimeter//2 + 1)
+    return area + perimeter//2 + 1
+
+def part_one(instructions: list[Instruction]):
+    """Solution to part one"""
+    return dig([(i.direction, i.steps) for i in instructions])
 
 # part two
 def part_two(instructions: list[Instruction]):
     """Solution to part two"""
-    # init
-    position = 0+0j
-    area = 0
-    perimeter = 0
-
-    for instruction in instructions:
-        decoded = instruction.decode()
-        v = decoded.vector
-        area += determinant(position, position + v)
-        perimeter += decoded.steps
-        position += decoded.vector
-    area = abs(area) // 2
-    return int(area + perimeter//2 + 1)
+    decoded = [i.decode() for i in instructions]
+    return dig([(i.direction, i.steps) for i in decoded])
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(INSTRUCTIONS)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -106,7 +94,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(INSTRUCTIONS)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
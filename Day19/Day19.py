@@ -1,8 +1,12 @@
 """AoC :: Day 19"""
 from dataclasses import dataclass
+import os
 import re
+import sys
 import time
 from typing import Dict, Literal
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 19
 
 # parse inputs
@@ -116,14 +120,13 @@ class Rule:
 
 
 class Workflow:
-    """a workflow"""
-    workflows: Dict[str, "Workflow"] = {}
-
-    def __init__(self, name: str, rules: list[Rule], end: str):
+    """a workflow (registered in the dict of workflows it belongs to)"""
+    def __init__(self, name: str, rules: list[Rule], end: str, workflows: Dict[str, "Workflow"]):
         self.name = name
         self.rules = rules
         self.end = end
 
+        self.workflows = workflows
         self.workflows[name] = self
 
     def __call__(self, rating: Rating) -> bool:
@@ -171,37 +174,38 @@ class Workflow:
         return rating_ranges + exited
 
     @staticmethod
-    def parse(string: str):
+    def parse(string: str, workflows: Dict[str, "Workflow"]):
         """parse a row into a workflow"""
         name, r = string.split(r"{")
         *rules, end = r.split(",")
         return Workflow(
             name,
             [Rule.parse(rule) for rule in rules],
-            end[:-1]
+            end[:-1],
+            workflows
         )
 
 
-with open('Day19/Day19.in', encoding="utf8") as f:
-    workflow_rows, rs = f.read().split("\n\n")
-    INIT = None
-    for row in workflow_rows.split("\n"):
-        w = Workflow.parse(row)
-        if w.name == "in":
-            INIT = w
-    RATINGS = [Rating.parse(i) for i in rs[:-1].split("\n")]
-
-if INIT is None:
-    raise ValueError("no 'in' workflow in inputs")
+def parse_input(text: str) -> tuple[Workflow, list[Rating]]:
+    """parse the workflows and ratings, returning the 'in' workflow and the ratings"""
+    workflow_rows, rs = text.split("\n\n")
+    workflows: Dict[str, Workflow] = {}
+    for row in workflow_rows.splitlines():
+        Workflow.parse(row, workflows)
+    if "in" not in workflows:
+        raise ValueError("no 'in' workflow in inputs")
+    return workflows["in"], [Rating.parse(i) for i in rs.splitlines()]
 
 # part one
-def part_one(init: Workflow, ratings: list[Rating]):
+def part_one(inputs: tuple[Workflow, list[Rating]]):
     """Solution to part one"""
+    init, ratings = inputs
     return sum(rating.total() for rating in ratings if init(rating))
 
 # part two
-def part_two(init: Workflow):
+def part_two(inputs: tuple[Workflow, list[Rating]]):
     """Solution to part two"""
+    init, _ = inputs
     ranges = [RatingRange(
         x=range(1,4001),
         m=range(1,4001),
@@ -214,7 +218,7 @@ def part_two(init: Workflow):
 
     while ranges:
         new_ranges = [
-            nr for r in ranges for nr in Workflow.workflows[r.then].apply_to_ranges(r)
+            nr for r in ranges for nr in init.workflows[r.then].apply_to_ranges(r)
         ]
         completed.extend(r for r in new_ranges if r.then in ("A", "R"))
         ranges = [r for r in new_ranges if r.then not in ("A", "R")]
@@ -222,14 +226,15 @@ def part_two(init: Workflow):
     return sum(r.vol() for r in completed)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(INIT, RATINGS)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -237,7 +242,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(INIT)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
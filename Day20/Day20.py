@@ -1,187 +1,151 @@
 """AoC :: Day 20"""
+from array import array
 from collections import deque
-from dataclasses import dataclass, field
 import math
+import os
 import re
+import sys
 import time
 from typing import Literal, Optional
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
+from graph import Graph  # pylint: disable=wrong-import-position
 day = 20
 
-@dataclass
-class Pulse:
-    """A pulse queue item"""
-    strength: bool
-    from_: str
-    affects: list[str]
-
-PULSES: deque[Pulse] = deque()
+# A pulse queue item: (strength, the module that sent it to all of its children)
+Pulse = tuple[bool, int]
 
 # Create an rx Exception to exit part 2
 class rxException(Exception):
     """Bail out of part 2 once you get this exception"""
 
-@dataclass
-class AbstractModule:
+class Modules:
     """
-    Base class for modules
-    
+    A collection of modules wired together as a graph
+
     Note:
     * `%` is a flip-flop module
     * `&` is a conjunction module
-    """
-    id: str
-    kind: Optional[Literal["%", "&", "broadcaster"]] = None
-    parents: Optional[list[str]] = field(default_factory=list)
-    children: Optional[list[str]] = field(default_factory=list)
-    state: bool = False
-    memory: dict[str, bool] = field(default_factory=dict)
-
-    def __call__(self, pulse: Pulse):
-        match self.kind:
-            case "%":
-                if pulse.strength:
-                    return None
-
-                self.state = not self.state
-
-                return Pulse(
-                    strength = self.state,
-                    from_ = self.id,
-                    affects = self.children
-                )
-            case "&":
-                self.memory[pulse.from_] = pulse.strength
-
-                return Pulse(
-                    strength = not all(self.memory.values()) if pulse.strength else True,
-                    from_ = self.id,
-                    affects = self.children
-                )
-            case "broadcaster":
-                return Pulse(
-                    strength = pulse.strength,
-                    from_ = self.id,
-                    affects = self.children
-                )
-            case _:
-                # Some modules have no kind and I guess are considered dead
-                # Relevant in part 2 surprise surprise
-                if (not pulse.strength) and self.id == "rx":
-                    raise StopIteration()
-
-    def has_parent(self, parent: str):
-        """Add a parent to this module"""
-        self.parents.append(parent)
-
-    def __add__(self, other: "AbstractModule"):
-        return AbstractModule(
-            kind = self.kind if self.kind is not None else other.kind,
-            id = self.id,
-            parents = self.parents + other.parents,
-            children = self.children + other.children,
-            state = self.state,
-            memory = self.memory | other.memory
-        )
 
-class Modules:
-    """A collection of modules"""
+    A pulse is sent along every out-edge of its sender. Each conjunction
+    remembers the last pulse along each of its in-edges by edge slot (see
+    graph.py), and keeps a count of how many of those were high.
+    """
     def __init__(self):
-        self._modules: dict[str, AbstractModule] = {}
+        self.graph = Graph()
+        self.kinds: dict[int, Literal["%", "&", "broadcaster"]] = {}
         self.pulses: deque[Pulse] = deque()
+        # The button is a module too, sending one low pulse to the broadcaster
+        self.button_id = self.graph.add_node("button")
+        # Module state, sized by initialise() once every module has been added
+        self.kind: list[Optional[str]] = []
+        self.state = bytearray()
+        self.memory = bytearray()
+        self.high_inputs = array('i')
+        self.inputs = array('i')
+        self.rx = -1
         # Counters
         self.lows = 0
         self.highs = 0
 
     @property
     def broadcaster(self):
-        """returns the unique broadcaster module"""
-        return self["broadcaster"]
-
-    def __getitem__(self, item: str):
-        if item not in self._modules:
-            new_module = AbstractModule(id = item)
-            self._modules[item] = new_module
-        return self._modules[item]
+        """returns the id of the unique broadcaster module"""
+        return self.graph.id("broadcaster")
 
-    def __setitem__(self, item: str, val: AbstractModule):
-        self._modules[item] = val
+    def add(self, kind: Literal["%", "&", "broadcaster"], id_: str, children: list[str]):
+        """add a new module and its connections"""
+        self.kinds[self.graph.add_node(id_)] = kind
+        for child in children:
+            self.graph.add_edge(id_, child)
 
     def initialise(self):
-        """Initialise the memory of the conjunction modules"""
-        for m in self._modules.values():
-            match m.kind:
+        """Initialise the state of the flip-flops and the memory of the conjunction modules"""
+        self.graph.add_edge("button", "broadcaster")
+        n = len(self.graph)
+        # Some modules have no kind and I guess are considered dead
+        self.kind = [self.kinds.get(v) for v in range(n)]
+        self.state = bytearray(n)
+        self.memory = bytearray(self.graph.edge_count)
+        self.high_inputs = array('i', [0]) * n
+        self.inputs = self.graph.in_degrees()
+        self.rx = self.graph.ids.get("rx", -1)
+
+    def deliver(self, pulse: Pulse):
+        """send a pulse to each of its recipients, queueing their responses"""
+        strength, sender = pulse
+        offsets, targets = self.graph.offsets, self.graph.targets
+        for e in range(offsets[sender], offsets[sender + 1]):
+            recipient = targets[e]
+            match self.kind[recipient]:
+                case "%":
+                    if not strength:
+                        self.state[recipient] ^= 1
+                        self.pulses.append((bool(self.state[recipient]), recipient))
                 case "&":
-                    m.memory = {parent: False for parent in m.parents}
+                    if self.memory[e] != strength:
+                        self.memory[e] = strength
+                        self.high_inputs[recipient] += 1 if strength else -1
+                    self.pulses.append((self.high_inputs[recipient] != self.inputs[recipient], recipient))
+                case "broadcaster":
+                    self.pulses.append((strength, recipient))
                 case _:
-                    pass
-
-    def add(self, module: AbstractModule):
-        """add a new module unknown to self or update with more information"""
-        self[module.id] += module
-        for child in module.children:
-            self[child].has_parent(module.id)
+                    # Relevant in part 2 surprise surprise
+                    if (not strength) and recipient == self.rx:
+                        raise StopIteration()
 
     def resolve(self):
         """resolve the pulse that has been in the queue for longest"""
         pulse = self.pulses.popleft()
         # update counter
-        match pulse.strength:
+        recipients = self.graph.degree(pulse[1])
+        match pulse[0]:
             case True:
-                self.highs += len(pulse.affects)
+                self.highs += recipients
             case False:
-                self.lows += len(pulse.affects)
-
-        # calculate effects
-        for recipient in pulse.affects:
-            if (response := self[recipient](pulse)) is not None:
-                self.pulses.append(response)
+                self.lows += recipients
+        self.deliver(pulse)
 
-    def part_two(self, tracking: list[str]):
-        """resolve the pulse that has been in the queue for longest"""
-        # track low pulses of & modules
+    def part_two(self, tracking: list[int]):
+        """press the button until the tracked modules have each sent high pulses in a steady cycle"""
+        # track high pulses of & modules
         ctr = 0
-        tracking = ["rd", "bt", "fv", "pr"]
         last = {m: 0 for m in tracking}
         cycles = {m: -1 for m in tracking}
         resolved = {m: False for m in tracking}
 
         while True:
-            try:
+            ctr += 1
+            self.button()
+            while self.pulses:
                 pulse = self.pulses.popleft()
+                strength, sender = pulse
 
-                if (pulse.strength) and (pulse.from_ in tracking):
+                if strength and (sender in last):
                     # Check if cycle detected
-                    if cycles[pulse.from_] == ctr - last[pulse.from_]:
-                        resolved[pulse.from_] = True
+                    if cycles[sender] == ctr - last[sender]:
+                        resolved[sender] = True
                         # Exit if resolved
                         if all(resolved.values()):
                             return math.lcm(*cycles.values())
                     else:
-                        resolved[pulse.from_] = False
+                        resolved[sender] = False
 
                     # Update tracking vals
-                    cycles[pulse.from_] = ctr - last[pulse.from_]
-                    last[pulse.from_] = ctr
+                    cycles[sender] = ctr - last[sender]
+                    last[sender] = ctr
 
                 # calculate effects
-                for recipient in pulse.affects:
-                    if (response := self[recipient](pulse)) is not None:
-                        self.pulses.append(response)
-            except IndexError:
-                ctr += 1
-                self.button()
+                self.deliver(pulse)
 
 
     def button(self):
         """push the button"""
-        self.pulses.append(Pulse(
-            strength=False,
-            from_="button",
-            affects=["broadcaster"]
-        ))
+        self.pulses.append((False, self.button_id))
 
     def md(self):
         """generate a mermaid diagram starting with the broadcaster"""
+        names = self.graph.names
         ms = [self.broadcaster]
         resolved = set()
 
@@ -189,10 +153,12 @@ class Modules:
         while ms:
             new_ms = []
             for m in ms:
-                if m.kind and m.id not in resolved:
-                    arrows += "\n".join(f"    {m.id}[{m.kind}{m.id}] --> {c}" for c in m.children) + "\n"
-                    new_ms.extend(self[c] for c in m.children if c not in resolved)
-                resolved.add(m.id)
+                if self.kind[m] and m not in resolved:
+                    arrows += "\n".join(
+                        f"    {names[m]}[{self.kind[m]}{names[m]}] --> {names[c]}" for c in self.graph.successors(m)
+                    ) + "\n"
+                    new_ms.extend(c for c in self.graph.successors(m) if c not in resolved)
+                resolved.add(m)
             ms = new_ms
 
         return (
@@ -202,35 +168,28 @@ class Modules:
             "```"
         ).replace("broadcasterbroadcaster", "broadcaster")
 
-MODULES = Modules()
-
 re_row = re.compile(r"([%&]|broadcaster)(\w+)? -> (.+)")
 def parse(s: str, modules: Modules):
     """Parse a row from inputs"""
     match_ = re_row.match(s)
     kind = match_.group(1)
+    affects = [child.strip() for child in match_.group(3).split(",")]
     if kind in ("%", "&"):
-        id_ = match_.group(2)
-        affects = [child.strip() for child in match_.group(3).split(",")]
-        modules.add(AbstractModule(
-            kind = kind,
-            id = id_,
-            children = affects
-        ))
+        modules.add(kind, match_.group(2), affects)
     elif kind == "broadcaster":
-        affects = [child.strip() for child in match_.group(3).split(",")]
-        modules.add(AbstractModule(
-            kind = kind,
-            id = kind,
-            children = affects
-        ))
+        modules.add(kind, kind, affects)
 
 
-with open('Day20/Day20.in', encoding="utf8") as f:
-    for line in f.readlines():
-        parse(line, MODULES)
+# Pushing the button changes the state of the modules
+MUTABLE_INPUTS = True
 
-MODULES.initialise()
+def parse_input(text: str) -> Modules:
+    """parse and initialise every module"""
+    modules = Modules()
+    for line in text.splitlines():
+        parse(line, modules)
+    modules.initialise()
+    return modules
 
 # part one
 def part_one(modules: Modules, n: int = 1000):
@@ -247,18 +206,21 @@ def part_one(modules: Modules, n: int = 1000):
 def part_two(modules: Modules):
     """Solution to part two"""
     TERMINUS = "rx"
-    tracking = [t for p in modules[TERMINUS].parents for t in modules[p].parents]
+    parents = modules.graph.reverse()
+    rx = modules.graph.id(TERMINUS)
+    tracking = [t for p in parents.successors(rx) for t in parents.successors(p)]
     return modules.part_two(tracking)
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one(MODULES)
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -266,7 +228,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two(MODULES)
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -1,8 +1,12 @@
 """AoC :: Day 22"""
+import os
 from queue import PriorityQueue
 from dataclasses import dataclass
 import re
+import sys
 import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 22
 
 @dataclass(order=True)
@@ -120,8 +124,9 @@ class Tower:
 
 
 # parse inputs
-with open('Day22/Day22.in', encoding="utf8") as f:
-    inputs = Tower([Brick.parse(i, s[:-1]) for i, s in enumerate(f.readlines())])
+def parse_input(text: str) -> Tower:
+    """parse the snapshot and let the bricks settle into a tower"""
+    return Tower([Brick.parse(i, s) for i, s in enumerate(text.splitlines())])
 
 # part one
 def part_one(tower: Tower):
@@ -134,14 +139,15 @@ def part_two(tower: Tower):
     return sum(tower.supporting_chain(b) for b in tower.bricks.values())
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = inputs.part_one()
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -3,32 +3,23 @@ AoC :: Day 23
 
 User be warned: this takes a damn long time to run
 """
+import os
 from queue import PriorityQueue
 from dataclasses import dataclass
+import sys
 import time
-from typing import Literal
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
+from directions import DIRECTIONS, DOWN, LEFT, REVERSE, RIGHT, UP  # pylint: disable=wrong-import-position
+from graph import Graph  # pylint: disable=wrong-import-position
+from grid import OFF_GRID, Grid  # pylint: disable=wrong-import-position
 day = 23
 
-@dataclass(order=True)
-class Position:
-    """a position in 2D space"""
-    x: int
-    y: int
-
-    def __add__(self, other: "Position"):
-        return Position(self.x + other.x, self.y + other.y)
-
-    def __eq__(self, other: "Position"):
-        return (self.x == other.x) and (self.y == other.y)
-
-    def __hash__(self):
-        return hash((self.x, self.y, "Position"))
-
 @dataclass(order=True)
 class Path:
     """The steps and record of positions on a path"""
     steps: int
-    positions: list[Position]
+    positions: list[int]
 
     @property
     def head(self):
@@ -38,7 +29,7 @@ class Path:
     def __getitem__(self, idx: int):
         return self.positions[idx]
 
-    def __contains__(self, val: Position):
+    def __contains__(self, val: int):
         return val in self.positions
 
     def __eq__(self, other: "Path"):
@@ -47,109 +38,62 @@ class Path:
     def __hash__(self):
         return hash((self.head, tuple(self.positions)))
 
-    def step(self, p: Position, d: int):
+    def step(self, p: int, d: int):
         """step to a new position"""
         return Path(self.steps + d, self.positions + [p])
 
-@dataclass
-class Tile:
-    """the kind of tile you're on"""
-    position: Position
-    kind: Literal["#", ".", ">", "v", "^", "<"]
+FOREST = ord("#")
+# The direction each slope runs, which can't be walked against
+SLOPES = {ord("^"): UP, ord(">"): RIGHT, ord("v"): DOWN, ord("<"): LEFT}
 
-    def legal(self, direction: Position, uphill: bool = False):
-        """whether movement onto this tile is legal"""
-        if uphill:
-            return self.kind != "#"
-
-        match self.kind:
-            case "#":
-                return False
-            case ".":
-                return True
-            case ">":
-                if direction.x == -1:
-                    return False
-                return True
-            case "<":
-                if direction.x == 1:
-                    return False
-                return True
-            case "^":
-                if direction.y == 1:
-                    return False
-                return True
-            case "v":
-                if direction.y == -1:
-                    return False
-                return True
-
-class TrailMap:
+class TrailMap(Grid):
     """A trail map"""
-    def __init__(self, tiles: list[list[Tile]]):
-        self.map = {tile.position: tile for row in tiles for tile in row}
-        self.dims = (max(p.x for p in self.map), max(p.y for p in self.map))
-
-    def __getitem__(self, item: Position | tuple[int, int]):
-        match item:
-            case Position():
-                pos = item
-            case tuple():
-                pos = Position(**item)
-
-        return self.map.get(pos, Tile(position=pos, kind="#"))
-
-    def adjacent(self, position: Position, uphill: bool = False):
+    def legal(self, position: int, direction: int, uphill: bool = False):
+        """whether movement onto this tile is legal"""
+        kind = self.cells[position]
+        if kind == FOREST:
+            return False
+        if uphill or kind not in SLOPES:
+            return True
+        return direction != REVERSE[SLOPES[kind]]
+
+    def adjacent(self, position: int, uphill: bool = False):
         """return adjacent positions"""
-        directions = [
-            Position( 1,  0),
-            Position(-1,  0),
-            Position( 0,  1),
-            Position( 0, -1),
-        ]
+        moves = self.moves
         return [
-            tile.position for d in directions if (tile := self[position + d]).legal(d, uphill)
+            p for d in DIRECTIONS
+            if (p := moves[4 * position + d]) != OFF_GRID and self.legal(p, d, uphill)
         ]
 
-    def fork(self, position: Position):
-        """return adjacent positions"""
-        directions = [
-            Position( 1,  0),
-            Position(-1,  0),
-            Position( 0,  1),
-            Position( 0, -1),
-        ]
-        return len([
-            tile.position for d in directions if (tile := self[position + d]).kind != "#"
-        ]) > 2
+    def fork(self, position: int):
+        """whether more than two paths meet at a position"""
+        return len([p for p in self.neighbours(position) if self.cells[p] != FOREST]) > 2
 
 
 # parse inputs
-with open('Day23/Day23.in', encoding="utf8") as f:
-    inputs = TrailMap([
-        [
-            Tile(
-                Position(c, i),
-                char
-            ) for c, char in enumerate(row[:-1])
-        ] for i, row in enumerate(f.readlines())
-    ])
-    START = Position(1, 0)
-    END = Position(inputs.dims[0] - 1, inputs.dims[1])
+def parse_input(text: str) -> TrailMap:
+    """parse the trail map"""
+    return TrailMap.parse(text)
 
 # part one
-def part_one(m: TrailMap, start: Position = START, end: Position = END):
+def part_one(m: TrailMap, start: int = None, end: int = None):
     """Solution to part one"""
-    forks = {pos for pos in m.map if (m[pos].kind != "#") and m.fork(pos)} | {start, end}
+    if start is None:
+        start = m.index(0, 1)
+    if end is None:
+        end = m.index(m.height - 1, m.width - 2)
+    forks = {pos for pos in range(len(m)) if (m.cells[pos] != FOREST) and m.fork(pos)} | {start, end}
     print(f"len(forks): {len(forks)}")
-    adjacency = {p: {} for p in forks}
+    # The trail contracted to the forks, weighted by the steps between them
+    junctions = Graph()
 
-    def populate_adjacency(start: Position, ends: set[Position]):
+    def populate_adjacency(start: int, ends: set[int]):
+        adjacency: dict[int, int] = {}
         cursors = {start}
         steps = 0
         visited = {start}
         while cursors:
-            new_cursors: set[Position] = set()
+            new_cursors: set[int] = set()
             steps += 1
             for cursor in cursors:
                 for adjacent in m.adjacent(cursor, uphill=True):
@@ -157,15 +101,19 @@ def part_one(m: TrailMap, start: Position = START, end: Position = END):
                         continue
 
                     if adjacent in ends:
-                        adjacency[start][adjacent] = steps
+                        adjacency[adjacent] = steps
                     else:
                         new_cursors.add(adjacent)
             visited.update(new_cursors)
             cursors = new_cursors
+        junctions.add_node(start)
+        for adjacent, steps in adjacency.items():
+            junctions.add_edge(start, adjacent, steps)
 
     for pos in forks:
         populate_adjacency(pos, forks)
 
+    start, end = junctions.id(start), junctions.id(end)
     paths = PriorityQueue()
     paths.put((0, Path(0, [start])))
     max_lens: dict[Path, int] = {}
@@ -174,7 +122,7 @@ def part_one(m: TrailMap, start: Position = START, end: Position = END):
         _, path = paths.get()
         path: Path
         pos = path.head
-        for q, d in adjacency[pos].items():
+        for q, d in junctions.edges(pos):
             if q not in path:
                 new_path = path.step(q, d)
                 if new_path.steps >= max_lens.get(new_path, 0):
@@ -184,13 +132,14 @@ def part_one(m: TrailMap, start: Position = START, end: Position = END):
     return max(p.steps for p in max_lens if end in p)
 
 # part two
-def part_two():
+def part_two(m: TrailMap):
     """Solution to part two"""
     return 2
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
@@ -204,7 +153,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two()
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
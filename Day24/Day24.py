@@ -6,11 +6,14 @@ two. Although my own attempt at the solution should have worked (I think...) rou
 numbers caused it to fail.
 """
 from dataclasses import dataclass
+import os
 import re
+import sys
 import time
+from fractions import Fraction
 from itertools import combinations
-from z3 import IntVector, Solver
-import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = 24
 
 # Regex for parsing
@@ -19,8 +22,8 @@ RE_HAIL = re.compile(r"(-?\d+),\s*(-?\d+),\s*(-?\d+)\s*@\s*(-?\d+),\s*(-?\d+),\s
 @dataclass
 class Hail:
     """A hailstone class which includes a position at t=0 and a velocity"""
-    position: np.ndarray
-    velocity: np.ndarray
+    position: tuple[int, int, int]
+    velocity: tuple[int, int, int]
 
     @staticmethod
     def parse(s: str):
@@ -28,13 +31,14 @@ class Hail:
         groups = RE_HAIL.match(s).groups()
         assert groups[4] != 0
         return Hail(
-            position = np.array(tuple(map(int, groups[:3])), dtype=int),
-            velocity = np.array(tuple(map(int, groups[3:])), dtype=int)
+            position = tuple(map(int, groups[:3])),
+            velocity = tuple(map(int, groups[3:]))
         )
 
 # parse inputs
-with open('Day24/Day24.in', encoding="utf8") as f:
-    inputs = [Hail.parse(i[:-1]) for i in f.readlines()]
+def parse_input(text: str) -> list[Hail]:
+    """parse every hailstone"""
+    return [Hail.parse(i) for i in text.splitlines()]
 
 
 # part one
@@ -46,23 +50,80 @@ def part_one(hail: list[Hail], min_: int = 200_000_000_000_000, max_: int = 400_
         dp1, dp2, _ = h1.velocity
         q1, q2, _ = h2.position
         dq1, dq2, _ = h2.velocity
-        sp = dp2 / dp1
-        sq = dq2 / dq1
+        # Solve p + t * dp == q + s * dq with Cramer's rule, in integers so nothing is rounded
+        det = dq1 * dp2 - dp1 * dq2
         # Skip if trajectories are parallel
-        if sp == sq:
+        if det == 0:
             continue
-        # Solve for (x, y) coords for collision
-        x, y = np.linalg.solve([[-sp, 1], [-sq, 1]], [p2 - sp * p1, q2 - sq * q1])
-        if (x - p1) / dp1 < 0 or (x - q1) / dq1 < 0:
+        t = dq1 * (q2 - p2) - dq2 * (q1 - p1)
+        s = dp1 * (q2 - p2) - dp2 * (q1 - p1)
+        # Flip signs so that the denominator is positive
+        if det < 0:
+            det, t, s = -det, -t, -s
+        if t < 0 or s < 0:
             continue
-        if min_ <= x <= max_ and min_ <= y <= max_:
+        # x = p1 + t/det * dp1, compared without dividing
+        x, y = p1 * det + t * dp1, p2 * det + t * dp2
+        if min_ * det <= x <= max_ * det and min_ * det <= y <= max_ * det:
             result += 1
 
     return result
 
 # part two
+def cross(a: tuple[int, int, int], b: tuple[int, int, int]):
+    """the cross product a x b"""
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+def solve(matrix: list[list[Fraction]], rhs: list[Fraction]):
+    """solve a square linear system exactly by Gaussian elimination, or return None if it is singular"""
+    n = len(matrix)
+    rows = [row + [b] for row, b in zip(matrix, rhs)]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if rows[r][col]), None)
+        if pivot is None:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(n):
+            if r != col and rows[r][col]:
+                f = rows[r][col] / rows[col][col]
+                rows[r] = [a - f * b for a, b in zip(rows[r], rows[col])]
+    return [rows[i][n] / rows[i][i] for i in range(n)]
+
+def rock(hail: list[Hail]):
+    """
+    Find the rock's position and velocity without z3
+
+    A rock P + Vt hits hailstone p + vt when (P - p) x (V - v) = 0. The P x V
+    term is the same for every hailstone, so subtracting the equations for
+    two hailstones i and j leaves three that are linear in P and V:
+        P x (v_j - v_i) + (p_j - p_i) x V = p_j x v_j - p_i x v_i
+    Two pairs give six equations in six unknowns, solved exactly.
+    """
+    for h0, h1, h2 in combinations(hail, 3):
+        matrix, rhs = [], []
+        for h in (h1, h2):
+            w = [b - a for a, b in zip(h0.velocity, h.velocity)]
+            u = [b - a for a, b in zip(h0.position, h.position)]
+            matrix += [
+                [0, w[2], -w[1], 0, -u[2], u[1]],
+                [-w[2], 0, w[0], u[2], 0, -u[0]],
+                [w[1], -w[0], 0, -u[1], u[0], 0],
+            ]
+            rhs += [b - a for a, b in zip(cross(h0.position, h0.velocity), cross(h.position, h.velocity))]
+        solution = solve([[Fraction(a) for a in row] for row in matrix], [Fraction(b) for b in rhs])
+        if solution is not None:
+            return solution[:3], solution[3:]
+    raise ValueError("no three hailstones determine the rock")
+
 def part_two(hail: list[Hail], MIN: int = 3):
     """Solution to part two"""
+    try:
+        # z3 is slow to import and optional, so only import it here
+        from z3 import IntVector, Solver  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        position, _ = rock(hail)
+        return int(sum(position))
+
     q1, q2, q3, dq1, dq2, dq3 = IntVector("sol", 6)
     # We only need 3 rocks to solve this
     ts = IntVector("t", min(MIN, len(hail)))
@@ -82,8 +143,9 @@ def part_two(hail: list[Hail], MIN: int = 3):
     return sum(m[v].as_long() for v in (q1, q2, q3))
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
@@ -1,36 +1,42 @@
 """AoC :: Day XX"""
 from dataclasses import dataclass
 import math
+import os
 import re
+import sys
 import time
 from typing import Dict, List, Literal, Set
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from loader import load  # pylint: disable=wrong-import-position
 day = XX
 
 
 # parse inputs
-with open('DayXX/DayXX.in', encoding="utf8") as f:
-    inputs = [i[:-1] for i in f.readlines()]
+def parse_input(text: str):
+    """Parse the puzzle input"""
+    return text.splitlines()
 
 
 # part one
-def part_one():
+def part_one(inputs: List[str]):
     """Solution to part one"""
     return 1
 
 # part two
-def part_two():
+def part_two(inputs: List[str]):
     """Solution to part two"""
     return 2
 
 # run both solutions and print outputs + runtime
-def main():
+def main(path: str = None):
     """The full days solution"""
+    inputs = load(day, parse_input, path)
     print(f":: Advent of Code 2023 -- Day {day} ::")
 
     # Part One
     print(":: Part One ::")
     t1 = -time.time()
-    a1 = part_one()
+    a1 = part_one(inputs)
     t1 += time.time()
     print(f"Answer: {a1}")
     print(f"runtime: {t1: .4f}s")
@@ -38,7 +44,7 @@ def main():
     # Part Two
     print(":: Part Two ::")
     t2 = -time.time()
-    a2 = part_two()
+    a2 = part_two(inputs)
     t2 += time.time()
     print(f"Answer: {a2}")
     print(f"runtime: {t2: .4f}s")
@@ -0,0 +1,113 @@
+"""
+Solve one day for many input files
+
+Each file matched by the glob(s) is solved in a ProcessPoolExecutor and a
+JSON line with its answers and timings (in nanoseconds) is printed as soon
+as it finishes. The main process reads the files and keeps a few more of
+them queued than there are workers, so the next input is always waiting
+when a worker finishes rather than being read while the worker sits idle.
+Parsing and solving both happen in the worker.
+
+e.g. py batch.py 7 'inputs/day07/*.in' --jobs 4 > answers.jsonl
+"""
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import time
+from runner import days_available, import_day, parts
+
+
+def solve(day: int, text: str, path: str = None) -> dict:
+    """parse and solve one input, returning its answers and timings"""
+    result = {"path": path, "day": day}
+    try:
+        module = import_day(day)
+        t = -time.perf_counter_ns()
+        inputs = module.parse_input(text)
+        t += time.perf_counter_ns()
+        result["parse"] = t
+        result["parts"] = {}
+        for name, part in parts(module).items():
+            if getattr(module, "MUTABLE_INPUTS", False) and result["parts"]:
+                # The previous part has consumed the inputs
+                inputs = module.parse_input(text)
+            # Keep anything the solution prints out of the JSON lines
+            with contextlib.redirect_stdout(io.StringIO()):
+                t = -time.perf_counter_ns()
+                answer = part(inputs)
+                t += time.perf_counter_ns()
+            result["parts"][name] = {"answer": str(answer), "time": t}
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        result["error"] = repr(err)
+    return result
+
+def read(path: str) -> str:
+    """read an input file"""
+    with open(path, encoding="utf8") as f:
+        return f.read()
+
+def expand(patterns: list[str]) -> list[str]:
+    """the files matched by some globs, in order and without duplicates"""
+    return list(dict.fromkeys(
+        path for pattern in patterns for path in sorted(glob.glob(pattern, recursive=True))
+        if os.path.isfile(path)
+    ))
+
+def batch(day: int, paths: list[str], jobs: int = None, ahead: int = 2):
+    """
+    Solve a day for each path, yielding results as they complete
+
+    At most jobs * ahead files are read and waiting in the pool at once.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = set()
+        for path in paths:
+            if len(pending) >= jobs * ahead:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+            try:
+                text = read(path)
+            except OSError as err:
+                yield {"path": path, "day": day, "error": repr(err)}
+                continue
+            pending.add(pool.submit(solve, day, text, path))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+
+
+def main(argv: list[str] = None):
+    """parse command line arguments and solve every matching input"""
+    parser = argparse.ArgumentParser(description="Solve one day for many inputs and print JSON lines")
+    parser.add_argument("day", type=int, help="day to solve")
+    parser.add_argument("inputs", nargs="+", help="input files or globs (quote them to use ** recursion)")
+    parser.add_argument("-j", "--jobs", type=int, help="number of worker processes (defaults to one per CPU)")
+    parser.add_argument("-o", "--output", help="write JSON lines here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.day not in days_available():
+        parser.error(f"no solution for day {args.day}")
+    paths = expand(args.inputs)
+    if not paths:
+        parser.error("no input files matched")
+
+    failed = 0
+    with open(args.output, 'w', encoding="utf8") if args.output else contextlib.nullcontext(sys.stdout) as out:
+        for result in batch(args.day, paths, jobs=args.jobs):
+            failed += "error" in result
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    if failed:
+        print(f"{failed} of {len(paths)} input(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
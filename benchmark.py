@@ -0,0 +1,169 @@
+"""
+Benchmark solutions
+
+Times each part with warmup and repetitions using perf_counter_ns, and
+reports min/median/p95 (in nanoseconds) as JSON so that runs can be compared.
+Parsing happens outside of the timed region. Days that set
+MUTABLE_INPUTS = True get a freshly parsed input for every repetition.
+
+--sweep times a day on synthetic inputs of increasing size (see generators)
+to show how each part scales with n, optionally plotting runtime against n
+if matplotlib is installed.
+
+e.g. py benchmark.py 5 7 --repeat 20 --warmup 2 > bench.json
+     py benchmark.py --record (see history.py)
+     py benchmark.py --sweep 17 --sizes 25 50 100 200 --plot day17.png
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from types import ModuleType
+from typing import Callable
+import generators
+import history
+import loader
+from runner import days_available, import_day, part_inputs, parts
+
+
+def percentile(samples: list[int], p: float):
+    """nearest-rank percentile of some samples"""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+def summarize(samples: list[int]):
+    """summary statistics of timings in ns"""
+    return {
+        "runs": len(samples),
+        "min": min(samples),
+        "median": int(statistics.median(samples)),
+        "p95": percentile(samples, 95),
+        "mean": int(statistics.fmean(samples)),
+    }
+
+def time_part(module: ModuleType, part: Callable, repeat: int = 10, warmup: int = 1, path: str = None):
+    """time a single part, returning its answer and the timing samples in ns"""
+    samples: list[int] = []
+    answer = None
+    for i in range(warmup + repeat):
+        # Re-create inputs that the solution mutates, otherwise use the cached parse
+        inputs = part_inputs(module, path)
+        t = -time.perf_counter_ns()
+        answer = part(inputs)
+        t += time.perf_counter_ns()
+        if i >= warmup:
+            samples.append(t)
+    return answer, samples
+
+def benchmark(day: int, repeat: int = 10, warmup: int = 1, path: str = None):
+    """benchmark both parts of a day"""
+    module = import_day(day)
+    text = loader.read(day, path)
+    result = {"day": day, "input_hash": hashlib.sha256(text.encode()).hexdigest(), "parts": {}}
+    for name, part in parts(module).items():
+        # Keep anything the solution prints out of the JSON report
+        with contextlib.redirect_stdout(io.StringIO()):
+            answer, samples = time_part(module, part, repeat=repeat, warmup=warmup, path=path)
+        result["parts"][name] = {"answer": str(answer)} | summarize(samples)
+    return result
+
+def run(days: list[int], repeat: int = 10, warmup: int = 1):
+    """benchmark a list of days"""
+    return {
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "results": [benchmark(day, repeat=repeat, warmup=warmup) for day in days],
+    }
+
+def sweep(day: int, sizes: list[int], repeat: int = 10, warmup: int = 1, seed: int = 0):
+    """benchmark a day on generated inputs of each size"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = generators.write(day, n, os.path.join(tmp, f"{n}.in"), seed=seed)
+            results.append({"n": n} | benchmark(day, repeat=repeat, warmup=warmup, path=path))
+            # Each size is only parsed for its own benchmark
+            loader.clear()
+    return {
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "seed": seed,
+        "results": results,
+    }
+
+def plot(report: dict, path: str):
+    """plot the median runtime of each part against n, or print it without matplotlib"""
+    lines: dict[str, tuple[list[int], list[float]]] = {}
+    for result in report["results"]:
+        for part, timing in result["parts"].items():
+            ns, ts = lines.setdefault(part, ([], []))
+            ns.append(result["n"])
+            ts.append(timing["median"] / 1e6)
+    try:
+        import matplotlib  # pylint: disable=import-outside-toplevel
+        matplotlib.use("Agg")
+        from matplotlib import pyplot as plt  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        print("matplotlib is not installed, median runtimes (ms):", file=sys.stderr)
+        for part, (ns, ts) in lines.items():
+            for n, t in zip(ns, ts):
+                print(f"part {part:<3} n={n:<8} {t:>12.3f}", file=sys.stderr)
+        return
+    fig, ax = plt.subplots()
+    for part, (ns, ts) in lines.items():
+        ax.plot(ns, ts, marker="o", label=f"part {part}")
+    ax.set_xlabel("n")
+    ax.set_ylabel("median runtime (ms)")
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_title(f"Day {report['results'][0]['day']}")
+    ax.legend()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def main(argv: list[str] = None):
+    """parse command line arguments and benchmark the requested days"""
+    parser = argparse.ArgumentParser(description="Benchmark AoC solutions and print JSON timings")
+    parser.add_argument("days", nargs="*", type=int, help="days to benchmark (defaults to every day)")
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="timed repetitions per part")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="untimed repetitions per part")
+    parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    parser.add_argument("--record", action="store_true", help="also store the timings in the history database")
+    parser.add_argument("--sweep", type=int, metavar="DAY", help="time a day on generated inputs of each --sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="input sizes for --sweep")
+    parser.add_argument("--seed", type=int, default=0, help="generator seed for --sweep")
+    parser.add_argument("--plot", help="with --sweep, plot runtime against n to this file")
+    args = parser.parse_args(argv)
+
+    if args.sweep:
+        if args.days or args.record:
+            parser.error("--sweep can't be combined with days or --record")
+        report = sweep(args.sweep, args.sizes, repeat=args.repeat, warmup=args.warmup, seed=args.seed)
+        if args.plot:
+            plot(report, args.plot)
+    else:
+        report = run(args.days or days_available(), repeat=args.repeat, warmup=args.warmup)
+    if args.record:
+        history.record(report)
+    if args.output:
+        with open(args.output, 'w', encoding="utf8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
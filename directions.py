@@ -0,0 +1,43 @@
+"""
+Directions as small ints
+
+UP, RIGHT, DOWN and LEFT are 0-3, clockwise, and everything that depends on
+a direction is a tuple indexed by it: turning, reversing, reflecting off a
+mirror, splitting on a splitter and the (row, col) step it makes. Each entry
+is built once at import, so following a rule in a hot loop is an index and
+never allocates. For a flat row-major grid, deltas(width) gives the index
+step in each direction (grid.Grid uses it for its move table).
+
+e.g. heading = TURN_RIGHT[heading]
+     row, col = row + DROW[heading], col + DCOL[heading]
+"""
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTIONS = (UP, RIGHT, DOWN, LEFT)
+NAMES = ("UP", "RIGHT", "DOWN", "LEFT")
+# Puzzle inputs spell directions as letters
+LETTERS = {"U": UP, "R": RIGHT, "D": DOWN, "L": LEFT}
+
+TURN_LEFT = (LEFT, UP, RIGHT, DOWN)
+TURN_RIGHT = (RIGHT, DOWN, LEFT, UP)
+REVERSE = (DOWN, LEFT, UP, RIGHT)
+
+# (row, col) step, with rows increasing down the page
+DROW = (-1, 0, 1, 0)
+DCOL = (0, 1, 0, -1)
+
+# The heading after bouncing off a mirror
+REFLECT = {
+    "/": (RIGHT, UP, LEFT, DOWN),
+    "\\": (LEFT, DOWN, RIGHT, UP),
+}
+# The headings after meeting a splitter, passing through if it's edge on
+SPLIT = {
+    "|": ((UP,), (UP, DOWN), (DOWN,), (UP, DOWN)),
+    "-": ((LEFT, RIGHT), (RIGHT,), (LEFT, RIGHT), (LEFT,)),
+}
+STRAIGHT = tuple((d,) for d in DIRECTIONS)
+
+
+def deltas(width: int) -> tuple[int, int, int, int]:
+    """the index step in each direction on a row-major grid of this width"""
+    return (-width, 1, width, -1)
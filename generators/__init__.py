@@ -0,0 +1,33 @@
+"""
+Synthetic puzzle inputs
+
+One module per day (generators/dayXX.py) with a generate(n, rng) function
+that returns a structurally valid input of size n. What n measures differs
+by day and is described in each module. Output is deterministic for a
+given seed.
+
+e.g. py -m generators 17 2000 --seed 1 -o Day17/big.in
+"""
+import importlib
+import os
+import random
+
+
+def generator(day: int):
+    """the generate(n, rng) function for a day"""
+    return importlib.import_module(f"{__name__}.day{str(day).zfill(2)}").generate
+
+def generate(day: int, n: int, seed: int = 0) -> str:
+    """generate an input of size n for a day"""
+    if n < 1:
+        raise ValueError(f"n must be positive, got {n}")
+    return generator(day)(n, random.Random(seed))
+
+def write(day: int, n: int, path: str, seed: int = 0):
+    """generate an input of size n for a day and write it to path"""
+    text = generate(day, n, seed=seed)
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding="utf8") as f:
+        f.write(text)
+    return path
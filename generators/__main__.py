@@ -0,0 +1,24 @@
+"""Write a synthetic input from the command line"""
+import argparse
+import sys
+from generators import generate, write
+
+
+def main(argv: list[str] = None):
+    """parse command line arguments and write the input"""
+    parser = argparse.ArgumentParser(prog="python -m generators", description="Generate synthetic AoC inputs")
+    parser.add_argument("day", type=int)
+    parser.add_argument("n", type=int, help="size of the input (see generators/dayXX.py)")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="write here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        write(args.day, args.n, args.output, seed=args.seed)
+    else:
+        sys.stdout.write(generate(args.day, args.n, seed=args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
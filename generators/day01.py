@@ -0,0 +1,23 @@
+"""Day 1: n lines of calibration text, each with at least one numeric digit"""
+import random
+import string
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """n calibration lines mixing letters, digits and spelled digits"""
+    lines = []
+    for _ in range(n):
+        chunks = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 8)):
+            match rng.randint(0, 2):
+                case 0:
+                    chunks.append(rng.choice(string.digits[1:]))
+                case 1:
+                    chunks.append(rng.choice(WORDS))
+                case 2:
+                    chunks.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(chunks)
+        lines.append(''.join(chunks))
+    return "\n".join(lines) + "\n"
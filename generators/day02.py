@@ -0,0 +1,16 @@
+"""Day 2: n games of 1-6 reveals each"""
+import random
+
+COLOURS = ["red", "green", "blue"]
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """n games where each reveal shows 1-20 cubes of up to three colours"""
+    lines = []
+    for game in range(1, n + 1):
+        reveals = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(COLOURS, rng.randint(1, 3))
+            reveals.append(", ".join(f"{rng.randint(1, 20)} {colour}" for colour in colours))
+        lines.append(f"Game {game}: " + "; ".join(reveals))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,25 @@
+"""Day 3: an n x n engine schematic"""
+import random
+
+SYMBOLS = "*#+$/@%&=-"
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """an n x n schematic of 1-3 digit numbers and symbols separated by '.'"""
+    rows = []
+    for _ in range(n):
+        row = ""
+        while len(row) < n:
+            match rng.choices(("number", "symbol", "dot"), weights=(2, 1, 12))[0]:
+                case "number":
+                    number = str(rng.randint(1, 999))
+                    # Numbers on the same row never touch
+                    if row and row[-1].isdigit():
+                        row += "."
+                    row += number[:n - len(row)]
+                case "symbol":
+                    row += rng.choice(SYMBOLS)
+                case "dot":
+                    row += "."
+        rows.append(row[:n])
+    return "\n".join(rows) + "\n"
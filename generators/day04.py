@@ -0,0 +1,24 @@
+"""Day 4: n scratchcards with 10 winning numbers and 25 numbers you have"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    n scratchcards
+
+    As in the real puzzle, no card wins copies of cards past the end of the table.
+    """
+    lines = []
+    # Card ids are padded to the same width so the numbers line up
+    width = max(len(str(n)), 3)
+    for i in range(n):
+        # Mostly small numbers of matches so the copies don't explode
+        matches = min(rng.choices(range(11), weights=(8, 6, 4, 3, 2, 2, 1, 1, 1, 1, 1))[0], n - 1 - i)
+        numbers = rng.sample(range(1, 100), 35 - matches)
+        win = numbers[:10]
+        has = rng.sample(win, matches) + numbers[10:]
+        rng.shuffle(has)
+        lines.append(
+            f"Card {i + 1:>{width}}: " + " ".join(f"{w:>2}" for w in win) + " | " + " ".join(f"{h:>2}" for h in has)
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,25 @@
+"""Day 5: an almanac with n seed ranges and n conversions in each of the seven maps"""
+import random
+
+MAPS = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+UPPER = 2**32
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """n seed ranges and seven maps of n non-overlapping conversions over [0, 2**32)"""
+    seeds = []
+    for _ in range(n):
+        start = rng.randrange(UPPER)
+        seeds += [start, rng.randint(1, (UPPER - start) // 8 + 1)]
+
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+    for source, destination in zip(MAPS, MAPS[1:]):
+        # Cut [0, 2**32) up into 2n points, pairs of which are the source ranges
+        cuts = sorted(rng.sample(range(UPPER), 2 * n))
+        rows = []
+        for start, stop in zip(cuts[0::2], cuts[1::2]):
+            width = stop - start
+            rows.append(f"{rng.randrange(UPPER - width)} {start} {width}")
+        rng.shuffle(rows)
+        blocks.append(f"{source}-to-{destination} map:\n" + "\n".join(rows))
+    return "\n\n".join(blocks) + "\n"
@@ -0,0 +1,19 @@
+"""Day 6: n races"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    n races with two digit times and three digit record distances
+
+    Every race can be won, and so can the single race read by ignoring the spaces.
+    """
+    times, distances = [], []
+    for _ in range(n):
+        t = rng.randint(40, 99)
+        times.append(t)
+        distances.append(rng.randint(100, min(999, t * t // 4 - 1)))
+    return (
+        "Time:     " + " ".join(f"{t:>5}" for t in times) + "\n"
+        "Distance: " + " ".join(f"{d:>5}" for d in distances) + "\n"
+    )
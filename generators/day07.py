@@ -0,0 +1,27 @@
+"""Day 7: n hands of camel cards"""
+import random
+
+CARDS = "23456789TJQKA"
+DISTINCT = len(CARDS) ** 5
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    n hands with bids from 1 to 1000
+
+    Hands are distinct up to the 13**5 possible hands. Beyond that they repeat,
+    which Hand.__lt__ refuses to rank.
+    """
+    if n <= DISTINCT:
+        codes = rng.sample(range(DISTINCT), n)
+    else:
+        codes = [rng.randrange(DISTINCT) for _ in range(n)]
+
+    lines = []
+    for code in codes:
+        cards = ""
+        for _ in range(5):
+            code, r = divmod(code, len(CARDS))
+            cards += CARDS[r]
+        lines.append(f"{cards} {rng.randint(1, 1000)}")
+    return "\n".join(lines) + "\n"
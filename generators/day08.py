@@ -0,0 +1,56 @@
+"""Day 8: instructions and a network of about n nodes"""
+import itertools
+import random
+import string
+
+CHARS = string.ascii_uppercase + string.digits
+
+
+def primes(upper: int) -> list[int]:
+    """the primes up to upper"""
+    return [p for p in range(2, upper + 1) if all(p % q for q in range(2, int(p**0.5) + 1))]
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    A network of about n nodes walked by up to six ghosts
+
+    Each ghost starts on a ..A node and then loops through a cycle of c * L
+    nodes (L the instruction length, c prime) ending on a ..Z node, so every
+    ghost hits its terminus in perfect cycles as part two assumes. The first
+    ghost starts on AAA and ends on ZZZ. Node names are three characters, so n
+    is capped at a little over 44,000.
+    """
+    k = max(1, min(6, n // 8))
+    per = max(1, (n - k) // k)
+    length = max(1, min(293, per // 8))
+    ps = primes(max(2, per // length))[-k:]
+    cycles = [ps[i % len(ps)] * length for i in range(k)]
+
+    pairs = [''.join(p) for p in itertools.product(CHARS, repeat=2)]
+    middles = [p + c for p in pairs for c in CHARS if c not in "AZ"]
+    if sum(cycles) - k > len(middles):
+        raise ValueError(f"n={n} needs more three character node names than exist")
+    starts = ["AAA"] + [p + "A" for p in rng.sample([p for p in pairs if p != "AA"], k - 1)]
+    ends = ["ZZZ"] + [p + "Z" for p in rng.sample([p for p in pairs if p != "ZZ"], k - 1)]
+    names = iter(rng.sample(middles, sum(cycles) - k))
+
+    instructions = ''.join(rng.choice("LR") for _ in range(length))
+    chains = [
+        [start] + [next(names) for _ in range(cycle - 1)] + [end]
+        for start, end, cycle in zip(starts, ends, cycles)
+    ]
+    everything = [name for chain in chains for name in chain]
+
+    rows = []
+    for chain in chains:
+        for position, name in enumerate(chain):
+            # The terminus loops back to the first node after the start
+            following = chain[position + 1] if position + 1 < len(chain) else chain[1]
+            # The other branch is never taken so it can go anywhere
+            other = rng.choice(everything)
+            if instructions[position % length] == "L":
+                rows.append(f"{name} = ({following}, {other})")
+            else:
+                rows.append(f"{name} = ({other}, {following})")
+    rng.shuffle(rows)
+    return instructions + "\n\n" + "\n".join(rows) + "\n"
@@ -0,0 +1,13 @@
+"""Day 9: n histories of 21 readings"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """n histories, each a random integer polynomial of degree < 10 sampled at 0..20"""
+    lines = []
+    for _ in range(n):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 10))]
+        lines.append(" ".join(
+            str(sum(c * x**i for i, c in enumerate(coefficients))) for x in range(21)
+        ))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,43 @@
+"""Day 10: an n x n field of pipes containing one loop through S"""
+import random
+from generators.shapes import tree_loop
+
+# The pipe joining two unit steps (dx, dy) with y increasing down the page
+PIPES = {
+    frozenset({(0, -1), (0, 1)}): "|",
+    frozenset({(1, 0), (-1, 0)}): "-",
+    frozenset({(0, -1), (1, 0)}): "L",
+    frozenset({(0, -1), (-1, 0)}): "J",
+    frozenset({(0, 1), (-1, 0)}): "7",
+    frozenset({(0, 1), (1, 0)}): "F",
+}
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    An n x n field (n >= 4) where the main loop takes up about half the tiles
+
+    The loop is the outline of a random tree (see shapes.tree_loop) drawn at
+    double scale, so there are tiles inside and outside of it. Every other
+    tile is a random pipe or ground, except that no junk pipe connects to S.
+    """
+    m = max(1, n // 4)
+    corners = tree_loop(m, rng)
+    loop = []
+    for (x1, y1), (x2, y2) in zip(corners, corners[1:] + corners[:1]):
+        loop += [(2 * x1, 2 * y1), (x1 + x2, y1 + y2)]
+
+    size = max(n, 4 * m)
+    grid = [[rng.choice("|-LJ7F..") for _ in range(size)] for _ in range(size)]
+    for i, (x, y) in enumerate(loop):
+        (px, py), (nx, ny) = loop[i - 1], loop[(i + 1) % len(loop)]
+        grid[y][x] = PIPES[frozenset({(px - x, py - y), (nx - x, ny - y)})]
+
+    sx, sy = rng.choice(loop)
+    grid[sy][sx] = "S"
+    on_loop = set(loop)
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        x, y = sx + dx, sy + dy
+        if 0 <= x < size and 0 <= y < size and (x, y) not in on_loop:
+            grid[y][x] = "."
+    return "\n".join(''.join(row) for row in grid) + "\n"
@@ -0,0 +1,14 @@
+"""Day 11: an n x n image of galaxies"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """an n x n image with about 2% galaxies and some empty rows and columns"""
+    empty_rows = {r for r in range(n) if rng.random() < 0.05}
+    empty_cols = {c for c in range(n) if rng.random() < 0.05}
+    return "\n".join(
+        ''.join(
+            "#" if r not in empty_rows and c not in empty_cols and rng.random() < 0.02 else "."
+            for c in range(n)
+        ) for r in range(n)
+    ) + "\n"
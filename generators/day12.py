@@ -0,0 +1,25 @@
+"""Day 12: n rows of springs"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """n rows of up to 20 springs, made from a valid arrangement with some conditions hidden"""
+    lines = []
+    for _ in range(n):
+        length = rng.randint(4, 20)
+        groups: list[int] = []
+        springs = ""
+        while True:
+            # Some operational springs then a damaged group
+            springs += "." * rng.randint(0 if not springs else 1, 3)
+            size = rng.randint(1, 6)
+            if len(springs) + size > length:
+                break
+            springs += "#" * size
+            groups.append(size)
+        if not groups:
+            springs, groups = "#", [1]
+        springs = springs.ljust(length, ".")[:max(length, len(springs.rstrip(".")))]
+        hidden = ''.join("?" if rng.random() < 0.5 else c for c in springs)
+        lines.append(f"{hidden} {','.join(map(str, groups))}")
+    return "\n".join(lines) + "\n"
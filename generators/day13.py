@@ -0,0 +1,28 @@
+"""Day 13: n patterns of ash and rocks"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    n patterns, each with a perfect reflection and a reflection with one smudge
+
+    Each pattern is built symmetric about a vertical line that leaves some
+    columns unpaired and about a horizontal line, then a cell in an unpaired
+    column is flipped. That keeps the vertical reflection perfect and leaves
+    the horizontal one with exactly one smudge.
+    """
+    patterns = []
+    for _ in range(n):
+        height, width = rng.randint(5, 17), rng.randint(5, 17)
+        a = rng.randint(1, (width - 1) // 2)
+        b = rng.randint(1, height - 1)
+        grid = [[rng.choice("#.") for _ in range(width)] for _ in range(height)]
+        for row in grid:
+            for c in range(a):
+                row[2 * a - 1 - c] = row[c]
+        for r in range(min(b, height - b)):
+            grid[b - 1 - r] = grid[b + r].copy()
+        row, col = rng.choice((b - 1, b)), rng.randint(2 * a, width - 1)
+        grid[row][col] = "#" if grid[row][col] == "." else "."
+        patterns.append("\n".join(''.join(row) for row in grid))
+    return "\n\n".join(patterns) + "\n"
@@ -0,0 +1,9 @@
+"""Day 14: an n x n platform of rocks"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """an n x n platform with about 20% rounded rocks and 15% cube rocks"""
+    return "\n".join(
+        ''.join(rng.choices("O#.", weights=(20, 15, 65), k=n)) for _ in range(n)
+    ) + "\n"
@@ -0,0 +1,16 @@
+"""Day 15: an initialization sequence of n steps"""
+import random
+import string
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """n steps over a pool of about n / 4 lens labels"""
+    labels = list({
+        ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(max(1, n // 4))
+    })
+    labels.sort()
+    steps = []
+    for _ in range(n):
+        label = rng.choice(labels)
+        steps.append(f"{label}={rng.randint(1, 9)}" if rng.random() < 0.6 else f"{label}-")
+    return ",".join(steps) + "\n"
@@ -0,0 +1,9 @@
+"""Day 16: an n x n contraption"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """an n x n contraption with about 10% mirrors and splitters"""
+    return "\n".join(
+        ''.join(rng.choices(".|-/\\", weights=(90, 2.5, 2.5, 2.5, 2.5), k=n)) for _ in range(n)
+    ) + "\n"
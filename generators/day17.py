@@ -0,0 +1,7 @@
+"""Day 17: an n x n heat loss map"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """an n x n map of heat loss digits 1-9"""
+    return "\n".join(''.join(rng.choices("123456789", k=n)) for _ in range(n)) + "\n"
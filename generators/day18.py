@@ -0,0 +1,51 @@
+"""Day 18: a dig plan of about n instructions"""
+import itertools
+import math
+import random
+from generators.shapes import tree_loop
+
+# The last hex digit of a colour code encodes the direction in part two
+HEX_DIRECTIONS = {"R": "0", "D": "1", "L": "2", "U": "3"}
+
+
+def corners(loop: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """drop the points of a loop that don't change direction"""
+    kept = []
+    for i, (x, y) in enumerate(loop):
+        (px, py), (nx, ny) = loop[i - 1], loop[(i + 1) % len(loop)]
+        if (x - px, y - py) != (nx - x, ny - y):
+            kept.append((x, y))
+    return kept
+
+def stretch(size: int, max_gap: int, rng: random.Random) -> list[int]:
+    """a random strictly increasing map from 0..size"""
+    return list(itertools.accumulate((rng.randint(1, max_gap) for _ in range(size)), initial=0))
+
+def instructions(points: list[tuple[int, int]], xs: list[int], ys: list[int]):
+    """the (direction, steps) to walk a loop of corners once mapped through xs and ys"""
+    for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+        if x1 == x2:
+            yield ("D" if y2 > y1 else "U"), abs(ys[y2] - ys[y1])
+        else:
+            yield ("R" if x2 > x1 else "L"), abs(xs[x2] - xs[x1])
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    A closed, non-crossing dig plan with about n instructions
+
+    The trench is the outline of a random tree (see shapes.tree_loop) with
+    its corners spread out by random monotone maps. The same outline is
+    stretched much further for the colour codes so part two digs the same
+    shape on a far larger scale.
+    """
+    m = max(1, math.ceil(math.sqrt(n / 1.4)))
+    points = corners(tree_loop(m, rng))
+    size = 2 * m + 1
+    small = instructions(points, stretch(size, 10, rng), stretch(size, 10, rng))
+    # A single instruction can cross the whole lattice, and has to fit in five hex digits
+    big_gap = max(1, 0xFFFFF // size)
+    big = instructions(points, stretch(size, big_gap, rng), stretch(size, big_gap, rng))
+    return "\n".join(
+        f"{d} {steps} (#{hex_steps:05x}{HEX_DIRECTIONS[hex_d]})"
+        for (d, steps), (hex_d, hex_steps) in zip(small, big)
+    ) + "\n"
@@ -0,0 +1,39 @@
+"""Day 19: n workflows and n part ratings"""
+import random
+import string
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    n workflows arranged as a tree under "in", and n part ratings
+
+    Every workflow is reachable from "in" and every branch ends in A or R,
+    so there are no cycles for either part to fall into.
+    """
+    names = ["in"]
+    seen = {"in", "A", "R"}
+    while len(names) < n:
+        name = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 3)))
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+
+    children: dict[str, list[str]] = {name: [] for name in names}
+    for i, name in enumerate(names[1:], 1):
+        children[names[rng.randrange(i)]].append(name)
+
+    workflows = []
+    for name in names:
+        targets = children[name] + rng.choices("AR", k=max(0, rng.randint(2, 4) - len(children[name])))
+        rng.shuffle(targets)
+        *ruled, default = targets
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}" for target in ruled
+        ]
+        workflows.append(f"{name}{{{','.join(rules + [default])}}}")
+    rng.shuffle(workflows)
+
+    ratings = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}" for _ in range(n)
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(ratings) + "\n"
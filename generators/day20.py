@@ -0,0 +1,52 @@
+"""Day 20: four n-bit counters feeding rx"""
+import itertools
+import random
+import string
+
+# Named as in the puzzle input
+INVERTERS = ("rd", "bt", "fv", "pr")
+RESERVED = {*INVERTERS, "vd", "rx"}
+
+
+def is_prime(p: int) -> bool:
+    """trial division"""
+    return p > 1 and all(p % q for q in range(2, int(p**0.5) + 1))
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    Four binary counters of n flip-flops each, built like the puzzle input
+
+    Each counter's conjunction fires after P presses for a prime P with n
+    bits, resets the counter and sends a low pulse through its inverter
+    (rd, bt, fv and pr) to vd and then to rx.
+    Part two has to press the button about 2^n times to see each cycle, so
+    keep n small (the puzzle uses 12). n is at least 5, below that rx would
+    get a low pulse within part one's 1000 presses.
+    """
+    n = max(5, n)
+    candidates = [p for p in range(2 ** (n - 1), 2 ** n) if is_prime(p)]
+    periods = rng.sample(candidates, 4) if len(candidates) >= 4 else rng.choices(candidates, k=4)
+
+    pool = [''.join(p) for p in itertools.product(string.ascii_lowercase, repeat=2)]
+    pool = [name for name in pool if name not in RESERVED]
+    if len(pool) < 4 * (n + 1):
+        raise ValueError(f"n={n} needs more two letter module names than exist")
+    names = iter(rng.sample(pool, 4 * (n + 1)))
+
+    rows = []
+    firsts = []
+    for period, inverter in zip(periods, INVERTERS):
+        flips = [next(names) for _ in range(n)]
+        counter = next(names)
+        firsts.append(flips[0])
+        bits = [(period >> i) & 1 for i in range(n)]
+        for i, flip in enumerate(flips):
+            outputs = flips[i + 1:i + 2] + ([counter] if bits[i] else [])
+            rows.append(f"%{flip} -> {', '.join(outputs)}")
+        resets = [flip for flip, bit in zip(flips, bits) if not bit or flip == flips[0]]
+        rows.append(f"&{counter} -> {', '.join(resets + [inverter])}")
+        rows.append(f"&{inverter} -> vd")
+    rows.append("&vd -> rx")
+    rows.append(f"broadcaster -> {', '.join(firsts)}")
+    rng.shuffle(rows)
+    return "\n".join(rows) + "\n"
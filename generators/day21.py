@@ -0,0 +1,24 @@
+"""Day 21: an n x n garden"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    An n x n garden (n made odd) with S in the middle
+
+    Like the puzzle input, the middle row and column and the border are
+    clear of rocks. Part two's default step count assumes the puzzle's
+    131 x 131 garden.
+    """
+    n = max(3, n | 1)
+    mid = n // 2
+    rows = []
+    for r in range(n):
+        row = [
+            "." if r in (0, mid, n - 1) or c in (0, mid, n - 1) or rng.random() >= 0.1 else "#"
+            for c in range(n)
+        ]
+        if r == mid:
+            row[mid] = "S"
+        rows.append(''.join(row))
+    return "\n".join(rows) + "\n"
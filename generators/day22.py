@@ -0,0 +1,32 @@
+"""Day 22: a snapshot of n falling bricks"""
+import math
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    n non-overlapping bricks of up to four cubes
+
+    The footprint grows with n (10 x 10 for the puzzle's ~1,200 bricks)
+    and bricks are scattered over enough height that most land on others.
+    """
+    width = max(10, round(10 * math.sqrt(n / 1200)))
+    height = max(10, 3 * n * 25 // (2 * width * width))
+    occupied = set()
+    bricks = []
+    while len(bricks) < n:
+        length = rng.randint(1, 4)
+        axis = rng.randrange(3)
+        start = [rng.randrange(width), rng.randrange(width), rng.randint(1, height)]
+        end = start.copy()
+        end[axis] += length - 1
+        if end[0] >= width or end[1] >= width:
+            continue
+        cubes = {
+            tuple(start[a] + (i if a == axis else 0) for a in range(3)) for i in range(length)
+        }
+        if cubes & occupied:
+            continue
+        occupied |= cubes
+        bricks.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+    return "\n".join(bricks) + "\n"
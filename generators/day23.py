@@ -0,0 +1,34 @@
+"""Day 23: an n x n hiking trail map"""
+import random
+from generators.shapes import spanning_tree
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    An n x n maze (n made odd) from the top left to the bottom right
+
+    Corridors are one tile wide, with a few extra openings so that there is
+    more than one route. Slopes are only placed where a corridor heads down
+    or right away from the start along the maze's tree, so the end is always
+    reachable in part one.
+    """
+    n = max(5, n | 1)
+    m = n // 2
+    grid = [["#"] * n for _ in range(n)]
+    for x in range(m):
+        for y in range(m):
+            grid[2 * y + 1][2 * x + 1] = "."
+    for (x1, y1), (x2, y2) in spanning_tree(m, rng):
+        wall = (x1 + x2 + 1, y1 + y2 + 1)
+        if (x2, y2) in ((x1 + 1, y1), (x1, y1 + 1)) and rng.random() < 0.1:
+            grid[wall[1]][wall[0]] = ">" if x2 > x1 else "v"
+        else:
+            grid[wall[1]][wall[0]] = "."
+    # Knock through some interior walls between two corridors to make loops
+    for _ in range(n // 4):
+        x, y = rng.randrange(1, n - 1), rng.randrange(1, n - 1)
+        if (x + y) % 2 and grid[y][x] == "#":
+            grid[y][x] = "."
+    grid[0][1] = "."
+    grid[n - 1][n - 2] = "."
+    return "\n".join(''.join(row) for row in grid) + "\n"
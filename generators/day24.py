@@ -0,0 +1,23 @@
+"""Day 24: n hailstones"""
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    n hailstones that a single thrown rock hits at distinct whole times
+
+    Positions are of the same magnitude as the puzzle's, so part one's test
+    area still applies, and no hailstone moves parallel to the rock.
+    """
+    rock = [rng.randint(10**14, 4 * 10**14) for _ in range(3)]
+    velocity = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(10**9, 10**12), n)
+    rows = []
+    for t in times:
+        while True:
+            v = [rng.randint(-300, 300) for _ in range(3)]
+            if v[0] and v != velocity:
+                break
+        p = [r + (u - w) * t for r, u, w in zip(rock, velocity, v)]
+        rows.append(f"{p[0]}, {p[1]}, {p[2]} @ {v[0]}, {v[1]}, {v[2]}")
+    return "\n".join(rows) + "\n"
@@ -0,0 +1,40 @@
+"""Day 25: a wiring diagram of n components"""
+import itertools
+import random
+import string
+
+
+def generate(n: int, rng: random.Random) -> str:
+    """
+    n components in two well connected halves joined by exactly three wires
+
+    Each half is a ring with every component also wired to the one two
+    along, so a half can't be split by fewer than four wires, plus random
+    wires between the others. The three wires between the halves are then
+    the unique minimum cut. Names are three letters, so 10 <= n <= 17,576.
+    """
+    pool = [''.join(p) for p in itertools.product(string.ascii_lowercase, repeat=3)]
+    if n > len(pool):
+        raise ValueError(f"n={n} needs more three letter component names than exist")
+    names = rng.sample(pool, max(10, n))
+    halves = names[:len(names) // 2], names[len(names) // 2:]
+
+    wires = set()
+    for half in halves:
+        for step in (1, 2):
+            for a, b in zip(half, half[step:] + half[:step]):
+                wires.add((min(a, b), max(a, b)))
+        for a in half:
+            for b in rng.sample([b for b in half if b != a], 4):
+                wires.add((min(a, b), max(a, b)))
+    for a, b in zip(rng.sample(halves[0], 3), rng.sample(halves[1], 3)):
+        wires.add((min(a, b), max(a, b)))
+
+    # List each wire once, under whichever end comes first
+    connections: dict[str, list[str]] = {}
+    for wire in sorted(wires):
+        a, b = rng.sample(wire, 2)
+        connections.setdefault(a, []).append(b)
+    rows = [f"{name}: {' '.join(others)}" for name, others in connections.items()]
+    rng.shuffle(rows)
+    return "\n".join(rows) + "\n"
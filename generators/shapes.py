@@ -0,0 +1,58 @@
+"""Shapes shared by more than one generator"""
+import random
+
+# (dx, dy) with y increasing down the page, as in the puzzle inputs
+STEPS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+def spanning_tree(m: int, rng: random.Random) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    """the edges of a random spanning tree of an m x m grid (randomised depth first search)"""
+    edges = []
+    visited = {(0, 0)}
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (x + dx, y + dy) for dx, dy in STEPS
+            if 0 <= x + dx < m and 0 <= y + dy < m and (x + dx, y + dy) not in visited
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nxt = rng.choice(options)
+        visited.add(nxt)
+        edges.append(((x, y), nxt))
+        stack.append(nxt)
+    return edges
+
+def tree_loop(m: int, rng: random.Random) -> list[tuple[int, int]]:
+    """
+    A random simple closed loop on a 2m x 2m lattice
+
+    The loop is the outline of a thickened random spanning tree of an m x m
+    grid, which is simply connected and never touches itself at a corner, so
+    the outline visits each of its lattice points exactly once. Consecutive
+    points are one unit step apart.
+    """
+    cells = set()
+    for (x1, y1), (x2, y2) in spanning_tree(m, rng):
+        cells |= {(2 * x1, 2 * y1), (x1 + x2, y1 + y2), (2 * x2, 2 * y2)}
+    cells.add((0, 0))
+
+    # Trace the boundary keeping the inside of the shape on the same side
+    following: dict[tuple[int, int], tuple[int, int]] = {}
+    for x, y in cells:
+        if (x, y - 1) not in cells:
+            following[(x, y)] = (x + 1, y)
+        if (x + 1, y) not in cells:
+            following[(x + 1, y)] = (x + 1, y + 1)
+        if (x, y + 1) not in cells:
+            following[(x + 1, y + 1)] = (x, y + 1)
+        if (x - 1, y) not in cells:
+            following[(x, y + 1)] = (x, y)
+
+    start = min(following)
+    loop = [start]
+    while (point := following[loop[-1]]) != start:
+        loop.append(point)
+    return loop
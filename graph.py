@@ -0,0 +1,212 @@
+"""
+Compact directed graphs for the graph puzzles
+
+A Graph interns node names (strings, or anything hashable) to int ids
+(0, 1, ... in the order they are first seen) and keeps its edges in CSR
+(compressed sparse row) form: the out-edges of node v are
+targets[offsets[v]:offsets[v + 1]], in the order they were added, with an
+optional parallel array of weights. Edge e is the same slot in targets and
+weights, so per-edge state can live in a flat array indexed by e. The CSR
+buffers are array('i') and are rebuilt on first use after an edge is added.
+
+bfs(), connected_components() and find_cycle() work on node ids.
+
+e.g. g = Graph()
+     g.add_edge("AAA", "BBB")
+     distances = bfs(g, g.id("AAA"))
+"""
+from array import array
+from collections import deque
+from typing import Hashable
+
+
+class Graph:
+    """a directed graph over interned node names with CSR adjacency"""
+    def __init__(self):
+        self.names: list[Hashable] = []
+        self.ids: dict[Hashable, int] = {}
+        # edges in the order they were added
+        self._sources = array('i')
+        self._targets = array('i')
+        self._weights: array | None = None
+        # CSR buffers, built on demand
+        self._offsets: array | None = None
+        self._csr_targets: array | None = None
+        self._csr_weights: array | None = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name: Hashable):
+        return name in self.ids
+
+    def id(self, name: Hashable) -> int:
+        """the id of a node by name, raising a KeyError if it's unknown"""
+        return self.ids[name]
+
+    def add_node(self, name: Hashable) -> int:
+        """intern a node name, returning its id"""
+        if name not in self.ids:
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+            self._offsets = None
+        return self.ids[name]
+
+    def add_edge(self, source: Hashable, target: Hashable, weight: int = None) -> int:
+        """add an edge between two named nodes (interning them), returning the source id"""
+        s, t = self.add_node(source), self.add_node(target)
+        if weight is not None and self._weights is None:
+            # edges added before the first weight count as 1
+            self._weights = array('q', [1]) * len(self._sources)
+        self._sources.append(s)
+        self._targets.append(t)
+        if self._weights is not None:
+            self._weights.append(1 if weight is None else weight)
+        self._offsets = None
+        return s
+
+    @property
+    def edge_count(self):
+        """the number of edges"""
+        return len(self._sources)
+
+    @property
+    def weighted(self):
+        """whether any edge was given a weight"""
+        return self._weights is not None
+
+    def _build(self):
+        """counting sort the edges by source into CSR buffers"""
+        n, m = len(self.names), len(self._sources)
+        offsets = array('i', [0]) * (n + 1)
+        for s in self._sources:
+            offsets[s + 1] += 1
+        for v in range(n):
+            offsets[v + 1] += offsets[v]
+        slot = offsets[:-1]
+        targets = array('i', [0]) * m
+        weights = array('q', [0]) * m if self._weights is not None else None
+        for e, (s, t) in enumerate(zip(self._sources, self._targets)):
+            targets[slot[s]] = t
+            if weights is not None:
+                weights[slot[s]] = self._weights[e]
+            slot[s] += 1
+        self._offsets, self._csr_targets, self._csr_weights = offsets, targets, weights
+
+    @property
+    def offsets(self) -> array:
+        """the out-edges of node v are in slots offsets[v] to offsets[v + 1]"""
+        if self._offsets is None:
+            self._build()
+        return self._offsets
+
+    @property
+    def targets(self) -> array:
+        """the target node of each edge slot"""
+        if self._offsets is None:
+            self._build()
+        return self._csr_targets
+
+    @property
+    def weights(self) -> array | None:
+        """the weight of each edge slot, or None if the graph is unweighted"""
+        if self._offsets is None:
+            self._build()
+        return self._csr_weights
+
+    def successors(self, v: int) -> array:
+        """the nodes that v has an edge to"""
+        offsets = self.offsets
+        return self.targets[offsets[v]:offsets[v + 1]]
+
+    def edges(self, v: int):
+        """(target, weight) for each out-edge of v, with weight 1 if the graph is unweighted"""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for e in range(offsets[v], offsets[v + 1]):
+            yield targets[e], (1 if weights is None else weights[e])
+
+    def degree(self, v: int) -> int:
+        """the number of out-edges of v"""
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def in_degrees(self) -> array:
+        """the number of in-edges of every node"""
+        degrees = array('i', [0]) * len(self)
+        for t in self._targets:
+            degrees[t] += 1
+        return degrees
+
+    def reverse(self):
+        """a graph with the same node ids and every edge reversed"""
+        other = Graph()
+        other.names, other.ids = self.names.copy(), self.ids.copy()
+        other._sources, other._targets = self._targets[:], self._sources[:]
+        other._weights = None if self._weights is None else self._weights[:]
+        return other
+
+
+def bfs(graph: Graph, source: int) -> array:
+    """the number of edges on a shortest path from source to every node, -1 if unreachable"""
+    offsets, targets = graph.offsets, graph.targets
+    distances = array('i', [-1]) * len(graph)
+    distances[source] = 0
+    queue = deque([source])
+    while queue:
+        v = queue.popleft()
+        for w in targets[offsets[v]:offsets[v + 1]]:
+            if distances[w] < 0:
+                distances[w] = distances[v] + 1
+                queue.append(w)
+    return distances
+
+def connected_components(graph: Graph) -> list[list[int]]:
+    """the weakly connected components (edges taken in either direction), largest first"""
+    parent = list(range(len(graph)))
+
+    def find(v: int):
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    offsets, targets = graph.offsets, graph.targets
+    for v in range(len(graph)):
+        for w in targets[offsets[v]:offsets[v + 1]]:
+            a, b = find(v), find(w)
+            if a != b:
+                parent[a] = b
+
+    components: dict[int, list[int]] = {}
+    for v in range(len(graph)):
+        components.setdefault(find(v), []).append(v)
+    return sorted(components.values(), key=len, reverse=True)
+
+def find_cycle(graph: Graph) -> list[int] | None:
+    """the nodes of some directed cycle in order, or None if the graph is acyclic"""
+    offsets, targets = graph.offsets, graph.targets
+    # 0 unvisited, 1 on the current path, 2 finished
+    colour = bytearray(len(graph))
+    for root in range(len(graph)):
+        if colour[root]:
+            continue
+        colour[root] = 1
+        path = [root]
+        # the next edge slot to try for each node on the path
+        stack = [offsets[root]]
+        while stack:
+            v = path[-1]
+            e = stack[-1]
+            if e == offsets[v + 1]:
+                colour[v] = 2
+                path.pop()
+                stack.pop()
+                continue
+            stack[-1] += 1
+            w = targets[e]
+            if colour[w] == 1:
+                return path[path.index(w):]
+            if not colour[w]:
+                colour[w] = 1
+                path.append(w)
+                stack.append(offsets[w])
+    return None
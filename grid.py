@@ -0,0 +1,122 @@
+"""
+Flat grids for the grid puzzles
+
+A Grid keeps a rectangular puzzle input in a single bytearray, row-major, so
+a cell is just an int index (row * width + col) instead of a Position,
+complex or tuple key. Directions are the ints from directions.py and moving
+in one is a lookup in a table built once per grid, which holds OFF_GRID for
+moves that would leave it. Days subclass Grid to add their own behaviour.
+
+e.g. grid = Grid.parse(text)
+     start = grid.find("S")
+     step = grid.move(start, RIGHT)
+"""
+from array import array
+from directions import DOWN, LEFT, RIGHT, UP, deltas
+
+# move() result for a step off the edge of the grid
+OFF_GRID = -1
+
+
+class Grid:
+    """a rectangular grid of single byte cells stored row-major in a bytearray"""
+    def __init__(self, width: int, height: int, cells: bytes | bytearray = None):
+        if cells is None:
+            cells = b"." * (width * height)
+        if len(cells) != width * height:
+            raise ValueError(f"{len(cells)} cells can't fill a {width} x {height} grid")
+        self.width = width
+        self.height = height
+        self.cells = bytearray(cells)
+        # index delta for a step in each direction, ignoring the edges
+        self.offsets = deltas(width)
+        self._moves: array | None = None
+
+    @classmethod
+    def parse(cls, text: str):
+        """parse a block of rows of the same length"""
+        rows = text.splitlines()
+        while rows and not rows[-1]:
+            rows.pop()
+        if not rows or any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("a grid needs one or more rows of the same length")
+        return cls(len(rows[0]), len(rows), ''.join(rows).encode())
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int | str):
+        self.cells[index] = ord(value) if isinstance(value, str) else value
+
+    def __str__(self):
+        return "\n".join(
+            self.cells[r * self.width:(r + 1) * self.width].decode() for r in range(self.height)
+        )
+
+    def index(self, row: int, col: int) -> int:
+        """the index of a cell"""
+        return row * self.width + col
+
+    def coords(self, index: int) -> tuple[int, int]:
+        """the (row, col) of an index"""
+        return divmod(index, self.width)
+
+    def find(self, char: str) -> int:
+        """the index of the first cell holding char, or OFF_GRID"""
+        return self.cells.find(ord(char))
+
+    @property
+    def moves(self) -> array:
+        """
+        The index reached by stepping from each cell in each direction
+
+        moves[4 * index + direction], or OFF_GRID at the edges. Built on
+        first use; hot loops should bind it to a local.
+        """
+        if self._moves is None:
+            w, h = self.width, self.height
+            up, right, down, left = self.offsets
+            moves = array('i', [OFF_GRID]) * (4 * w * h)
+            for i in range(w * h):
+                row, col = divmod(i, w)
+                if row > 0:
+                    moves[4 * i + UP] = i + up
+                if col < w - 1:
+                    moves[4 * i + RIGHT] = i + right
+                if row < h - 1:
+                    moves[4 * i + DOWN] = i + down
+                if col > 0:
+                    moves[4 * i + LEFT] = i + left
+            self._moves = moves
+        return self._moves
+
+    def move(self, index: int, direction: int) -> int:
+        """the index one step away in a direction, or OFF_GRID"""
+        return self.moves[4 * index + direction]
+
+    def neighbours(self, index: int) -> list[int]:
+        """the indices of the (up to four) cells adjacent to an index"""
+        return [i for i in self.moves[4 * index:4 * index + 4] if i != OFF_GRID]
+
+    def edge(self, direction: int) -> range:
+        """the indices along the side of the grid that direction points towards"""
+        w, h = self.width, self.height
+        if direction == UP:
+            return range(0, w)
+        if direction == RIGHT:
+            return range(w - 1, w * h, w)
+        if direction == DOWN:
+            return range(w * (h - 1), w * h)
+        if direction == LEFT:
+            return range(0, w * h, w)
+        raise ValueError(f"invalid direction {direction}")
+
+    def copy(self):
+        """a copy of the grid with its own cells"""
+        other = type(self).__new__(type(self))
+        other.__dict__.update(self.__dict__)
+        other.cells = self.cells.copy()
+        return other
@@ -0,0 +1,164 @@
+"""
+Benchmark history
+
+Persists benchmark.py reports to a local SQLite file keyed by git commit,
+Python version and input hash, and compares commits to flag regressions.
+
+e.g. py benchmark.py --record
+     py history.py compare <baseline commit> [<candidate commit>] --threshold 10
+"""
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DB = os.path.join(ROOT, "benchmarks.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS timings (
+    id         INTEGER PRIMARY KEY,
+    recorded   REAL NOT NULL,
+    git_commit TEXT NOT NULL,
+    python     TEXT NOT NULL,
+    day        INTEGER NOT NULL,
+    part       TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    answer     TEXT,
+    runs       INTEGER NOT NULL,
+    min        INTEGER NOT NULL,
+    median     INTEGER NOT NULL,
+    p95        INTEGER NOT NULL,
+    mean       INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS timings_key ON timings (git_commit, python, day, part, input_hash);
+"""
+STATS = ("min", "median", "p95", "mean")
+
+
+def connect(db: str = DB):
+    """open the history database, creating it if needed"""
+    con = sqlite3.connect(db)
+    con.executescript(SCHEMA)
+    return con
+
+def git_commit():
+    """the current commit hash, suffixed with -dirty if the tree has changes"""
+    def git(*args: str):
+        return subprocess.run(
+            ["git", *args], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        commit = git("rev-parse", "HEAD")
+        dirty = git("status", "--porcelain", "--untracked-files=no")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty else "")
+
+def record(report: dict, db: str = DB, commit: str = None):
+    """store a benchmark.py report, returning the commit it was stored under"""
+    commit = commit or git_commit()
+    now = time.time()
+    with connect(db) as con:
+        con.executemany(
+            "INSERT INTO timings "
+            "(recorded, git_commit, python, day, part, input_hash, answer, runs, min, median, p95, mean) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    now, commit, report["python"], result["day"], part, result["input_hash"],
+                    timing["answer"], timing["runs"], *(timing[stat] for stat in STATS)
+                )
+                for result in report["results"] for part, timing in result["parts"].items()
+            ]
+        )
+    return commit
+
+def latest(con: sqlite3.Connection, commit: str, stat: str = "median"):
+    """the most recent timing per (python, day, part, input hash) for a commit"""
+    rows = con.execute(
+        f"SELECT python, day, part, input_hash, {stat} FROM timings "
+        "WHERE git_commit = ? ORDER BY recorded",
+        (commit,)
+    ).fetchall()
+    # Later rows overwrite earlier ones
+    return {row[:4]: row[4] for row in rows}
+
+def resolve(con: sqlite3.Connection, commit: str):
+    """expand an abbreviated commit to one that has been recorded, preferring an exact match"""
+    if con.execute("SELECT 1 FROM timings WHERE git_commit = ? LIMIT 1", (commit,)).fetchone():
+        return commit
+    matches = [
+        row[0] for row in con.execute(
+            "SELECT DISTINCT git_commit FROM timings WHERE git_commit LIKE ?", (commit + "%",)
+        )
+    ]
+    if len(matches) != 1:
+        raise KeyError(f"{commit!r} matches {len(matches)} recorded commits")
+    return matches[0]
+
+def compare(baseline: str, candidate: str = None, threshold: float = 10.0, stat: str = "median", db: str = DB):
+    """
+    Compare a candidate commit (defaults to the current one) against a baseline
+
+    Returns (key, baseline ns, candidate ns, % change) for every part timed in
+    both, and the subset that regressed by more than threshold percent.
+    """
+    if stat not in STATS:
+        raise ValueError(f"stat must be one of {STATS}, got {stat}")
+    with connect(db) as con:
+        base = latest(con, resolve(con, baseline), stat)
+        cand = latest(con, resolve(con, candidate or git_commit()), stat)
+
+    rows = [
+        (key, base[key], cand[key], 100 * (cand[key] - base[key]) / base[key])
+        for key in sorted(base.keys() & cand.keys()) if base[key]
+    ]
+    return rows, [row for row in rows if row[3] > threshold]
+
+
+def main(argv: list[str] = None):
+    """record or compare benchmark runs"""
+    parser = argparse.ArgumentParser(description="Store and compare benchmark history")
+    parser.add_argument("--db", default=DB, help="SQLite file to use")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rec = commands.add_parser("record", help="store a JSON report from benchmark.py")
+    rec.add_argument("report", help="JSON report file")
+    rec.add_argument("--commit", help="record under this commit instead of HEAD")
+
+    cmp = commands.add_parser("compare", help="flag parts that regressed against a baseline")
+    cmp.add_argument("baseline", help="baseline commit")
+    cmp.add_argument("candidate", nargs="?", help="candidate commit (defaults to HEAD)")
+    cmp.add_argument("-t", "--threshold", type=float, default=10.0, help="regression threshold in percent")
+    cmp.add_argument("-s", "--stat", default="median", choices=STATS, help="statistic to compare")
+    args = parser.parse_args(argv)
+
+    match args.command:
+        case "record":
+            with open(args.report, encoding="utf8") as f:
+                commit = record(json.load(f), db=args.db, commit=args.commit)
+            print(f"Recorded {args.report} under {commit}")
+            return 0
+        case "compare":
+            try:
+                rows, regressions = compare(
+                    args.baseline, args.candidate, threshold=args.threshold, stat=args.stat, db=args.db
+                )
+            except KeyError as err:
+                parser.error(err.args[0])
+            for (python, day, part, _), base, cand, change in rows:
+                flag = "  REGRESSION" if change > args.threshold else ""
+                print(f"py{python} Day {day:>2} part {part:<3} {base/1e6:>10.3f}ms -> {cand/1e6:>10.3f}ms ({change:+6.1f}%){flag}")
+            if regressions:
+                print(f"{len(regressions)} part(s) regressed by more than {args.threshold}%")
+                return 1
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
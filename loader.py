@@ -0,0 +1,144 @@
+"""
+Lazily load puzzle inputs
+
+Solutions call load(day, parser) from main() rather than parsing at import,
+so importing a day is cheap. Parsed inputs are cached in memory so repeated
+runs in the same process skip the parse, unless the parser's module sets
+MUTABLE_INPUTS = True (its parts change the inputs), in which case every
+load() parses afresh.
+
+There is also an opt-in disk cache (enable_disk_cache() or AOC_CACHE=1) that
+pickles the parsed inputs next to the input file, e.g.
+DayXX/DayXX.in.<key>.pickle. The key hashes the input file, the source of
+the module that defines the parser, and the source of the shared modules
+it uses (grid.py, graph.py, directions.py, ...), so editing any of them
+invalidates the cache.
+"""
+import glob
+import hashlib
+import inspect
+import os
+import pickle
+from types import ModuleType
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Set to "1" to use the disk cache (inherited by worker processes)
+ENV_DISK_CACHE = "AOC_CACHE"
+
+# (parser, absolute input path) -> parsed inputs
+_CACHE: dict[tuple[Callable, str], object] = {}
+
+
+def input_path(day: int) -> str:
+    """the default DayXX/DayXX.in path for a day"""
+    name = 'Day' + str(day).zfill(2)
+    return os.path.join(ROOT, name, f"{name}.in")
+
+def read(day: int, path: str = None) -> str:
+    """read the raw puzzle input for a day, or from an alternate path"""
+    with open(path or input_path(day), encoding="utf8") as f:
+        return f.read()
+
+def enable_disk_cache(enable: bool = True):
+    """turn the disk cache on or off for this process and any it starts"""
+    if enable:
+        os.environ[ENV_DISK_CACHE] = "1"
+    else:
+        os.environ.pop(ENV_DISK_CACHE, None)
+
+def disk_cache_enabled() -> bool:
+    """whether load() will use the disk cache"""
+    return os.environ.get(ENV_DISK_CACHE) == "1"
+
+def shared_modules(module: ModuleType) -> list[ModuleType]:
+    """
+    The shared top-level modules (grid.py, graph.py, ...) a module uses
+
+    These build the objects a parser returns, so their source is part of
+    the cache key too. Found through the module's globals, transitively,
+    and returned sorted by name.
+    """
+    found: dict[str, ModuleType] = {}
+    pending = [module]
+    while pending:
+        for value in vars(pending.pop()).values():
+            used = value if isinstance(value, ModuleType) else inspect.getmodule(value)
+            path = getattr(used, "__file__", None)
+            if path and os.path.dirname(os.path.abspath(path)) == ROOT and used.__name__ not in found:
+                found[used.__name__] = used
+                pending.append(used)
+    # The loader itself doesn't build anything a parser returns
+    return [found[name] for name in sorted(found) if name != __name__ and found[name] is not module]
+
+def cache_key(text: str, parser: Callable) -> str:
+    """hash the input along with the parser's module name and source, and that of the shared modules it uses"""
+    module = inspect.getmodule(parser)
+    try:
+        source = inspect.getsource(module)
+    except (OSError, TypeError):
+        source = inspect.getsource(parser)
+    if module is not None:
+        source += "".join(inspect.getsource(shared) for shared in shared_modules(module))
+    h = hashlib.sha256()
+    for part in (text, parser.__module__, parser.__qualname__, source):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+def cache_path(path: str, key: str) -> str:
+    """where the pickled inputs for an input file and key live"""
+    return f"{path}.{key}.pickle"
+
+def parse_cached(text: str, parser: Callable[[str], T], path: str) -> T:
+    """parse with the disk cache, replacing any stale pickles for this input"""
+    key = cache_key(text, parser)
+    cached = cache_path(path, key)
+    try:
+        with open(cached, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # Treat a corrupt or incompatible pickle as a miss
+        pass
+
+    parsed = parser(text)
+    # Changing the input or the parser changes the key, so older pickles are stale
+    for stale in glob.glob(glob.escape(path) + ".*.pickle"):
+        if stale != cached:
+            os.remove(stale)
+    try:
+        with open(cached, 'wb') as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError, RecursionError):
+        # Not everything can be pickled, just don't cache it
+        os.remove(cached)
+    return parsed
+
+def load(day: int, parser: Callable[[str], T], path: str = None, disk_cache: bool = None) -> T:
+    """
+    Parse the inputs for a day on first access and cache the result
+
+    parser is called with the full text of the input file. Pass path to
+    use an input other than DayXX/DayXX.in. disk_cache defaults to
+    disk_cache_enabled(). If the parser's module sets MUTABLE_INPUTS the
+    result is never held in memory, so each call gets its own copy.
+    """
+    key = (parser, os.path.abspath(path or input_path(day)))
+    if key in _CACHE:
+        return _CACHE[key]
+    text = read(day, key[1])
+    if disk_cache_enabled() if disk_cache is None else disk_cache:
+        parsed = parse_cached(text, parser, key[1])
+    else:
+        parsed = parser(text)
+    if not getattr(inspect.getmodule(parser), "MUTABLE_INPUTS", False):
+        _CACHE[key] = parsed
+    return parsed
+
+def clear():
+    """forget every cached input held in memory"""
+    _CACHE.clear()
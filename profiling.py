@@ -0,0 +1,114 @@
+"""
+Per-part instrumentation
+
+Wraps each part of a day in cProfile (the top-N functions by own time) or
+tracemalloc (peak traced memory and the top-N allocation sites still alive
+when the part returns). Used by runner.py's --profile and --trace-memory.
+
+import_time() imports a day in a fresh interpreter under -X importtime and
+reports the total and its slowest imports, for runner.py's --import-time.
+
+e.g. py runner.py 16 22 --profile --top 15
+     py runner.py 23 --trace-memory
+     py runner.py --all --import-time --top 5
+"""
+import cProfile
+import io
+import pstats
+import subprocess
+import sys
+import tracemalloc
+from typing import Callable
+from runner import ROOT, folder, import_day, part_inputs, parts
+
+# Imports a day and prints how long it took, with a marker on stderr so that
+# the -X importtime lines for runner itself can be skipped
+IMPORT_SCRIPT = """
+import sys, time
+sys.path.insert(0, {root!r})
+import runner
+print("-- day --", file=sys.stderr, flush=True)
+t = -time.perf_counter_ns()
+runner.import_day({day})
+t += time.perf_counter_ns()
+print(t)
+"""
+
+
+def profile_part(part: Callable, inputs, top: int = 20, sort: str = "tottime"):
+    """run a part under cProfile, returning its answer and the top-N report"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        answer = part(inputs)
+    finally:
+        profiler.disable()
+    buffer = io.StringIO()
+    pstats.Stats(profiler, stream=buffer).sort_stats(sort).print_stats(top)
+    return answer, buffer.getvalue()
+
+def trace_part(part: Callable, inputs, top: int = 20):
+    """run a part under tracemalloc, returning its answer, peak bytes and the top-N allocation sites"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        answer = part(inputs)
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]).statistics("lineno")[:top]
+    return answer, peak, "\n".join(str(stat) for stat in stats)
+
+def import_time(day: int, top: int = 20):
+    """
+    Import a day in a fresh interpreter under -X importtime
+
+    Returns the total import time in ns and the top-N imports by cumulative
+    time as (cumulative us, self us, module) tuples. Raises ImportError if
+    the day can't be imported.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT.format(root=ROOT, day=day)],
+        capture_output=True, text=True, cwd=ROOT, check=False
+    )
+    if proc.returncode:
+        raise ImportError(f"{folder(day)} failed to import:\n{proc.stderr.strip().splitlines()[-1]}")
+    imports = []
+    _, _, lines = proc.stderr.partition("-- day --")
+    for line in lines.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        imports.append((int(cumulative_us), int(self_us), module.rstrip()))
+    imports.sort(reverse=True)
+    return int(proc.stdout.split()[-1]), imports[:top]
+
+def instrument(day: int, profile: bool = False, trace_memory: bool = False, top: int = 20, path: str = None):
+    """print profiling and/or memory reports for each part of a day"""
+    module = import_day(day)
+    print(f":: {folder(day)} ::")
+    for name, part in parts(module).items():
+        if profile:
+            answer, report = profile_part(part, part_inputs(module, path), top=top)
+            print(f":: Part {name.title()} :: cProfile (answer: {answer})")
+            print(report)
+        if trace_memory:
+            answer, peak, report = trace_part(part, part_inputs(module, path), top=top)
+            print(f":: Part {name.title()} :: tracemalloc (answer: {answer})")
+            print(f"peak: {peak / 2**10:,.1f} KiB")
+            print(report)
+            print()
+
+def report_import_time(day: int, top: int = 20):
+    """print the import time of a day and its slowest imports"""
+    total, imports = import_time(day, top=top)
+    print(f":: {folder(day)} :: import {total / 1e6:,.1f}ms")
+    if imports:
+        print(f"{'cumulative [us]':>16} {'self [us]':>10} | imported package")
+    for cumulative_us, self_us, module in imports:
+        print(f"{cumulative_us:>16,} {self_us:>10,} |{module}")
+    print()
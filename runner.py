@@ -0,0 +1,225 @@
+"""
+Run one or more days in a single interpreter
+
+Each day is imported once and its main() is run with stdout captured into
+DayXX/DayXX.out, exactly as the `runday` shell function does, but without
+paying interpreter startup for every day. Days can optionally be fanned out
+over a ProcessPoolExecutor.
+
+The answers each day prints are checked against the known-good answers
+already recorded in its DayXX.out, and a day that disagrees fails loudly
+rather than overwriting them. --verify only does the check, running every
+day in parallel, and fails a day that has no recorded answers yet.
+
+e.g. py runner.py 5 7 9
+     py runner.py --all --jobs 4
+     py runner.py --all --verify
+     py runner.py 16 --profile --trace-memory (see profiling.py)
+     py runner.py --all --import-time
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import contextlib
+import importlib.util
+import io
+import os
+import re
+import sys
+from types import ModuleType
+from typing import Callable
+import loader
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PATTERN = re.compile(r"Day(\d{2})")
+# The parts of a solution and the function names that implement them
+PARTS = {"one": "part_one", "two": "part_two"}
+RE_ANSWER = re.compile(r"^Answer: (.*)$", re.M)
+
+
+class AnswerError(Exception):
+    """A solution disagrees with the known-good answers in its DayXX.out"""
+
+
+def days_available() -> list[int]:
+    """return the days that have a DayXX/DayXX.py solution"""
+    return sorted(
+        int(m[1]) for i in os.listdir(ROOT)
+        if (m := PATTERN.fullmatch(i)) and os.path.isfile(os.path.join(ROOT, i, f"{i}.py"))
+    )
+
+def folder(day: int) -> str:
+    """the DayXX folder name for a day"""
+    return 'Day' + str(day).zfill(2)
+
+def import_day(day: int) -> ModuleType:
+    """import a DayXX module by day number (only imported once per process)"""
+    name = folder(day)
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, name, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+def parts(module: ModuleType) -> dict[str, Callable]:
+    """the part functions a day implements (e.g. Day 25 has no part two)"""
+    return {part: getattr(module, name) for part, name in PARTS.items() if hasattr(module, name)}
+
+def part_inputs(module: ModuleType, path: str = None):
+    """the parsed inputs to pass to a part, re-parsed if the day sets MUTABLE_INPUTS (see loader.py)"""
+    return loader.load(module.day, module.parse_input, path)
+
+def run_day(day: int) -> str:
+    """run a day's main() and return what it printed"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        import_day(day).main()
+    return buffer.getvalue()
+
+def out_path(day: int) -> str:
+    """the DayXX/DayXX.out path for a day"""
+    name = folder(day)
+    return os.path.join(ROOT, name, f"{name}.out")
+
+def write_out(day: int, output: str):
+    """write output to DayXX/DayXX.out"""
+    with open(out_path(day), 'w', encoding="utf8") as f:
+        f.write(output)
+
+def answers(output: str) -> list[str]:
+    """the answers printed by a day's main()"""
+    return RE_ANSWER.findall(output)
+
+def expected(day: int) -> list[str]:
+    """the known-good answers recorded in DayXX.out (empty if it has never been run)"""
+    if not os.path.isfile(out_path(day)):
+        return []
+    with open(out_path(day), encoding="utf8") as f:
+        return answers(f.read())
+
+def check(day: int, output: str):
+    """raise an AnswerError if output disagrees with the recorded answers"""
+    known, got = expected(day), answers(output)
+    if len(got) < len(known):
+        raise AnswerError(f"{folder(day)} printed {len(got)} answer(s), expected {len(known)}")
+    for part, (k, g) in enumerate(zip(known, got), 1):
+        if k != g:
+            raise AnswerError(f"{folder(day)} part {part}: expected {k}, got {g}")
+
+def process(day: int, verify: bool = True, write: bool = True):
+    """run a day, check it against its recorded answers and write DayXX.out"""
+    if verify and not write and not expected(day):
+        # Nothing to check against, so it can't be called verified
+        raise AnswerError(f"{folder(day)} has no recorded answers in {os.path.basename(out_path(day))}")
+    output = run_day(day)
+    if verify:
+        check(day, output)
+    if write:
+        write_out(day, output)
+
+def run(days: list[int], jobs: int = 1, verify: bool = True, write: bool = True) -> list[int]:
+    """
+    Run the days in this process, or across a process pool if jobs > 1
+
+    Returns the days that failed verification or raised. A failing day's
+    DayXX.out is left untouched.
+    """
+    failed = []
+
+    def report(day: int, outcome: Callable[[], None]):
+        try:
+            outcome()
+        except AnswerError as err:
+            print(f"FAILED {err}", file=sys.stderr)
+            failed.append(day)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            print(f"FAILED {folder(day)} raised {err!r}", file=sys.stderr)
+            failed.append(day)
+        else:
+            print(f"{'Ran' if write else 'Verified'} {folder(day)}")
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(process, day, verify, write): day for day in days}
+            for future in as_completed(futures):
+                report(futures[future], future.result)
+    else:
+        for day in days:
+            report(day, lambda day=day: process(day, verify, write))
+    return sorted(failed)
+
+
+def main(argv: list[str] = None):
+    """parse command line arguments and run the requested days"""
+    parser = argparse.ArgumentParser(description="Run AoC solutions and write DayXX.out files")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (defaults to the latest day)")
+    parser.add_argument("--all", action="store_true", help="run every day")
+    parser.add_argument(
+        "-j", "--jobs", type=int,
+        help="number of worker processes (defaults to 1, or one per day with --verify)"
+    )
+    checks = parser.add_mutually_exclusive_group()
+    checks.add_argument(
+        "--verify", action="store_true", help="only check answers against DayXX.out, don't write it"
+    )
+    checks.add_argument(
+        "--no-verify", action="store_true", help="overwrite DayXX.out even if the answers changed"
+    )
+    parser.add_argument("--cache", action="store_true", help="cache parsed inputs on disk (see loader.py)")
+    parser.add_argument(
+        "--profile", action="store_true", help="print the hottest functions per part instead of running main()"
+    )
+    parser.add_argument(
+        "--trace-memory", action="store_true", help="print peak allocation per part instead of running main()"
+    )
+    parser.add_argument(
+        "--import-time", action="store_true", help="print how long each day takes to import instead of running main()"
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="entries to show with --profile/--trace-memory/--import-time"
+    )
+    args = parser.parse_args(argv)
+
+    available = days_available()
+    if args.all:
+        days = available
+    elif args.days:
+        days = args.days
+    elif available:
+        days = available[-1:]
+    else:
+        print("No 'DayXX' directories found.")
+        return 1
+
+    missing = [day for day in days if day not in available]
+    if missing:
+        parser.error(f"no solution for day(s) {', '.join(map(str, missing))}")
+
+    if args.cache:
+        loader.enable_disk_cache()
+
+    if args.profile or args.trace_memory or args.import_time:
+        # profiling imports this module, so only import it when needed
+        from profiling import instrument, report_import_time  # pylint: disable=import-outside-toplevel
+        for day in days:
+            if args.import_time:
+                report_import_time(day, top=args.top)
+            if args.profile or args.trace_memory:
+                instrument(day, profile=args.profile, trace_memory=args.trace_memory, top=args.top)
+        return 0
+
+    jobs = args.jobs or (len(days) if args.verify else 1)
+    failed = run(days, jobs=jobs, verify=not args.no_verify, write=not args.verify)
+    if failed:
+        print(f"{len(failed)} day(s) failed: {', '.join(map(str, failed))}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+"""Checks for the in-process runner"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import runner  # pylint: disable=wrong-import-position
+
+
+def test_mutable_inputs_rerun():
+    """Day 20 presses the button on its inputs, so a second run must not reuse them"""
+    assert runner.run([20, 20], verify=True, write=False) == []